@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2025 Russ Fellows <russ.fellows@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+pytest configuration for the dl-driver Python test scripts.
+
+`--cached` skips test cases that passed on a previous run with unchanged
+inputs, so incremental runs only re-execute new, failing or affected cases.
+Each passed case is stored with a digest of the framework sources, its test
+module and its parameters; any change to those re-runs it. Pass state is kept
+in pytest's own cache directory (see `pytest --cache-show` / `--cache-clear`).
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+_PASSED_KEY = "dl_driver/passed_digests"
+_FRAMEWORKS_DIR = Path(__file__).resolve().parents[2] / "py_api" / "src" / "frameworks"
+
+def _sources_digest(paths):
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(str(path).encode())
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            pass
+    return h.hexdigest()
+
+def _item_digest(item, frameworks_digest):
+    """Digest of everything a case's outcome depends on."""
+    h = hashlib.sha256(frameworks_digest.encode())
+    h.update(_sources_digest([Path(str(item.fspath))]).encode())
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None:
+        h.update(repr(sorted(callspec.params.items())).encode())
+    return h.hexdigest()
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="skip test cases that passed on a previous run with unchanged inputs",
+    )
+
+def pytest_collection_modifyitems(config, items):
+    if getattr(config, "cache", None) is None:
+        return
+
+    frameworks_digest = _sources_digest(_FRAMEWORKS_DIR.glob("*.py"))
+    config._dl_driver_digests = {item.nodeid: _item_digest(item, frameworks_digest) for item in items}
+    if not config.getoption("--cached"):
+        return
+
+    passed = config.cache.get(_PASSED_KEY, {})
+    skip = pytest.mark.skip(reason="passed on a previous run with unchanged inputs (--cached)")
+    for item in items:
+        if passed.get(item.nodeid) == config._dl_driver_digests[item.nodeid]:
+            item.add_marker(skip)
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if getattr(config, "cache", None) is None:
+        return
+
+    digests = getattr(config, "_dl_driver_digests", {})
+    passed = config.cache.get(_PASSED_KEY, {})
+    for report in terminalreporter.stats.get("failed", []):
+        passed.pop(report.nodeid, None)
+    for report in terminalreporter.stats.get("passed", []):
+        if report.nodeid in digests:
+            passed[report.nodeid] = digests[report.nodeid]
+    config.cache.set(_PASSED_KEY, passed)
@@ -10,44 +10,337 @@ Measures overhead, throughput, and memory usage.
 
 import sys
 import os
+import json
+import argparse
 import time
+import resource
+import multiprocessing
+import threading
 import traceback
+import logging
+import logging.handlers
+import queue
+import itertools
+import functools
+import importlib
+import importlib.util
 import tracemalloc
-import statistics
 import numpy as np
-from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+
+# Optional: finer-grained RSS sampling for benchmark_function(mode="psutil")
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def _lazy_import(name: str):
+    """
+    Register module `name` without executing it; the real import happens on
+    first attribute access. Returns None if the module is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# torch/tensorflow take seconds to import, so they are only loaded once a
+# benchmark touches them (not for the "test data not found" exit, say).
+# torch drives CUDA prefetching, tf the tf.data prefetching.
+torch = _lazy_import('torch')
+tf = _lazy_import('tensorflow')
 
 # Add the framework path to sys.path
 sys.path.insert(0, '/home/eval/Documents/Rust-Devel/dl-driver/crates/py_api/src')
 
-def benchmark_function(func, *args, **kwargs) -> Tuple[float, float, Any]:
+# Each benchmark repetition runs in a fresh child forked from a forkserver that
+# already has the frameworks imported, so every run starts from the same warm
+# state instead of the first run paying for imports, CUDA init and dylib loads.
+# Preload entries that fail to import are skipped by the forkserver.
+_MP_CONTEXT = multiprocessing.get_context("forkserver")
+_MP_CONTEXT.set_forkserver_preload([
+    "torch", "tensorflow", "s3dlio", "frameworks.pytorch", "frameworks.tensorflow"
+])
+
+@functools.lru_cache(maxsize=None)
+def _load_dataset_class(framework: str, module: str, name: str):
+    """
+    Import a dl-driver dataset class (or other framework attribute) on first
+    use and cache the outcome.
+    
+    Benchmarks call this before their timed region, so creation timings
+    measure only dataset construction. `framework` was already located by
+    _lazy_import, so a missing install is reported without attempting (and
+    paying for) a failing import.
+    
+    Returns:
+        Tuple of (dataset_class or None, ImportError or None)
+    """
+    if framework not in sys.modules:
+        return None, ImportError(f"{framework} is not installed")
+    try:
+        return getattr(importlib.import_module(module), name), None
+    except ImportError as e:
+        return None, e
+
+# Benchmark configs are built once and passed to the frameworks uncopied (the
+# PyTorch dataset no longer copies config_dict). That is safe because every
+# run executes in its own worker process (see run_multiple_benchmarks), so a
+# run that mutated one could not leak into the next.
+PYTORCH_BENCH_CONFIG = {
+    'dataset': {
+        'data_folder': 'file:///mnt/vast1/dlio_data_generated',
+        'format': 'npz',
+        'num_files_train': 10,
+        'record_length_bytes': 1048576,
+        'num_samples_per_file': 1
+    },
+    'reader': {
+        'data_loader': 'pytorch',
+        'batch_size': 4,
+        'read_threads': 2
+    },
+    'train': {
+        'epochs': 1,
+        'seed': 42
+    }
+}
+
+TENSORFLOW_BENCH_CONFIG = {
+    'dataset': {
+        'data_folder': 'file:///mnt/vast1/dlio_data_generated',
+        'format': 'npz',
+        'num_files_train': 10,
+        'record_length_bytes': 1048576,
+        'num_samples_per_file': 1
+    },
+    'reader': {
+        'data_loader': 'tensorflow',
+        'batch_size': 2,
+        'read_threads': 2
+    },
+    'train': {
+        'epochs': 1,
+        'seed': 42
+    }
+}
+
+# LoaderOptions for the pure s3dlio PyTorch benchmark. These mirror what
+# DlioPyTorchDataset builds from PYTORCH_BENCH_CONFIG (its PyTorch defaults:
+# batch_size 32, 4 workers, prefetch 2, shuffle with seed 42), so both sides
+# are benchmarked with the same loader settings rather than s3dlio defaults.
+PURE_S3DLIO_LOADER_OPTS = {
+    "file_pattern": "*.npz",
+    "shuffle": True,
+    "seed": 42,
+    "batch_size": 32,
+    "num_workers": 4,
+    "prefetch": 2
+}
+
+# Status output from the parent process goes through a QueueHandler and is
+# written by a background QueueListener thread, keeping stdout writes off the
+# threads that drive the benchmarks
+logger = logging.getLogger("dl_driver.benchmark")
+
+def _start_log_listener(stream) -> logging.handlers.QueueListener:
+    """Attach a queue-backed handler to `logger` and start the thread that drains it to `stream`."""
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+# Polling interval for the background RSS sampler
+RSS_SAMPLE_INTERVAL_S = 0.01
+
+def _sample_rss(stop: threading.Event, samples: List[int]) -> None:
+    """Append this process's RSS to `samples` every RSS_SAMPLE_INTERVAL_S until stopped."""
+    process = psutil.Process()
+    while True:
+        samples.append(process.memory_info().rss)
+        if stop.wait(RSS_SAMPLE_INTERVAL_S):
+            break
+
+def benchmark_function(func, *args, mode: str = "rusage", **kwargs) -> Tuple[float, float, Any]:
     """
     Benchmark a function measuring execution time and memory usage.
     
+    Args:
+        mode: How memory is measured:
+            "rusage" (default) - growth of the process peak RSS (ru_maxrss);
+                covers the C-side allocations of torch/tf/s3dlio at no cost
+            "psutil" - peak RSS sampled every 10ms on a background thread,
+                relative to the RSS at call start (falls back to "rusage"
+                when psutil is not installed)
+            "tracemalloc" - Python allocations only; hooks every allocation
+                and slows the measured call noticeably
+    
     Returns:
         Tuple of (execution_time_seconds, peak_memory_mb, result)
     """
+    if mode == "psutil" and psutil is None:
+        mode = "rusage"
+    
     # Start memory tracking
-    tracemalloc.start()
+    if mode == "tracemalloc":
+        tracemalloc.start()
+    elif mode == "psutil":
+        baseline_rss = psutil.Process().memory_info().rss
+        samples = []
+        stop = threading.Event()
+        sampler = threading.Thread(target=_sample_rss, args=(stop, samples), daemon=True)
+        sampler.start()
+    else:
+        usage_before = resource.getrusage(resource.RUSAGE_SELF)
     
-    # Measure execution time
-    start_time = time.perf_counter()
+    # Measure execution time in integer nanoseconds; the first clock read is
+    # a warm-up so the measurement doesn't pay for a cold clock path
+    time.perf_counter_ns()
+    start_ns = time.perf_counter_ns()
     result = func(*args, **kwargs)
-    end_time = time.perf_counter()
+    end_ns = time.perf_counter_ns()
     
     # Get memory usage
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    if mode == "tracemalloc":
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_memory_mb = peak / 1024 / 1024  # Convert bytes to MB
+    elif mode == "psutil":
+        stop.set()
+        sampler.join()
+        samples.append(psutil.Process().memory_info().rss)  # calls shorter than one interval
+        peak_memory_mb = max(max(samples) - baseline_rss, 0) / 1024 / 1024
+    else:
+        usage_after = resource.getrusage(resource.RUSAGE_SELF)
+        peak_memory_mb = (usage_after.ru_maxrss - usage_before.ru_maxrss) / 1024  # ru_maxrss is KB on Linux
     
-    execution_time = end_time - start_time
-    peak_memory_mb = peak / 1024 / 1024  # Convert bytes to MB
+    execution_time = (end_ns - start_ns) * 1e-9
     
     return execution_time, peak_memory_mb, result
 
-def benchmark_pure_s3dlio_pytorch() -> Dict[str, Any]:
+@dataclass(slots=True)
+class BenchResult:
+    """Outcome of one benchmark run; the metrics stay NaN when the run failed."""
+    framework: str
+    creation_time_s: float = float('nan')
+    creation_memory_mb: float = float('nan')
+    iteration_time_s: float = float('nan')
+    iteration_memory_mb: float = float('nan')
+    items_loaded: int = 0
+    bytes_loaded: int = 0
+    success: bool = True
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+
+def _sizeof(item) -> int:
+    """Payload size in bytes of a loaded item (tensor, array, bytes or a container of them)."""
+    if hasattr(item, 'element_size'):  # torch.Tensor
+        return item.element_size() * item.nelement()
+    if hasattr(item, 'nbytes'):  # np.ndarray, memoryview
+        return int(item.nbytes)
+    if hasattr(item, 'dtype') and hasattr(item, 'shape'):  # tf.Tensor
+        return item.dtype.size * int(item.shape.num_elements() or 0)
+    if isinstance(item, (bytes, bytearray)):
+        return len(item)
+    if isinstance(item, (tuple, list)):
+        return sum(_sizeof(x) for x in item)
+    if isinstance(item, dict):
+        return sum(_sizeof(v) for v in item.values())
+    return sys.getsizeof(item)
+
+def iterate_dataset(dataset, max_items: int) -> Tuple[int, int]:
+    """
+    Consume up to max_items from dataset (limited to avoid long benchmarks).
+    
+    Items are dropped as soon as they are measured, so large payloads are not
+    kept alive for the whole timed region. Datasets exposing a batched
+    next_batch(n) API are drained with one call instead of per-item __next__
+    round trips.
+    
+    Returns:
+        Tuple of (items_loaded, bytes_loaded)
+    """
+    next_batch = getattr(dataset, 'next_batch', None)
+    if callable(next_batch):
+        batch = next_batch(max_items)
+        return len(batch), _sizeof(batch)
+    
+    count = 0
+    total_bytes = 0
+    for item in itertools.islice(dataset, max_items):
+        count += 1
+        total_bytes += _sizeof(item)
+    return count, total_bytes
+
+def iterate_dataset_cuda(dataset, max_items: int) -> Tuple[int, int]:
+    """
+    iterate_dataset through dl-driver's side-stream _CudaPrefetcher when a GPU
+    is available, so the benchmark measures the copy path the driver runs.
+    """
+    if torch is None or not torch.cuda.is_available():
+        return iterate_dataset(dataset, max_items)
+    _CudaPrefetcher, import_error = _load_dataset_class("torch", "frameworks.pytorch", "_CudaPrefetcher")
+    if _CudaPrefetcher is None:
+        raise import_error
+    _map_batch, _ = _load_dataset_class("torch", "frameworks.pytorch", "_map_batch")
+    
+    # Pin items as DataLoader(pin_memory=True) does in the driver, so the
+    # non_blocking copies are really asynchronous. Slice before prefetching so
+    # no item beyond max_items is fetched.
+    pinned = (_map_batch(item, lambda t: t.pin_memory()) for item in itertools.islice(dataset, max_items))
+    result = iterate_dataset(_CudaPrefetcher(pinned, 'cuda'), max_items)
+    torch.cuda.synchronize()  # include outstanding copies in the timed region
+    return result
+
+def iterate_tf_dataset(dataset, max_items: int) -> Tuple[int, int]:
+    """iterate_dataset over a tf.data pipeline, prefetching so reads overlap the Python loop."""
+    return iterate_dataset(dataset.take(max_items).prefetch(tf.data.AUTOTUNE), max_items)
+
+def measure_phases(create_dataset, iterate, max_items: int) -> Tuple[float, float, float, float, int, int]:
+    """
+    Create a dataset and iterate it inside a single benchmark_function call.
+    
+    The phases are split with nested clock and ru_maxrss reads, so the memory
+    tracker is started once per run and both phases share one sampling window.
+    
+    Returns:
+        Tuple of (creation_time_s, creation_memory_mb, iteration_time_s,
+        iteration_memory_mb, items_loaded, bytes_loaded)
+    """
+    def run_phases():
+        t0 = time.perf_counter_ns()
+        dataset = create_dataset()
+        t1 = time.perf_counter_ns()
+        maxrss_created = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        items_loaded, bytes_loaded = iterate(dataset, max_items)
+        t2 = time.perf_counter_ns()
+        return (t1 - t0) * 1e-9, (t2 - t1) * 1e-9, maxrss_created, items_loaded, bytes_loaded
+    
+    maxrss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    _, peak_memory_mb, (creation_time, iteration_time, maxrss_created, items_loaded, bytes_loaded) = \
+        benchmark_function(run_phases)
+    
+    creation_memory_mb = (maxrss_created - maxrss_start) / 1024  # ru_maxrss is KB on Linux
+    iteration_memory_mb = max(peak_memory_mb - creation_memory_mb, 0.0)
+    return creation_time, creation_memory_mb, iteration_time, iteration_memory_mb, items_loaded, bytes_loaded
+
+def benchmark_pure_s3dlio_pytorch() -> BenchResult:
     """Benchmark pure s3dlio PyTorch integration."""
-    print("🔧 Benchmarking pure s3dlio PyTorch...")
+    print("🔧 Benchmarking pure s3dlio PyTorch...", file=sys.stderr)  # stdout is reserved for the JSON results
     
     try:
         import torch
@@ -56,111 +349,69 @@ def benchmark_pure_s3dlio_pytorch() -> Dict[str, Any]:
         def create_dataset():
             data_folder = "/mnt/vast1/dlio_data_generated"
             uri = f"file://{data_folder}"
-            loader_opts = {"file_pattern": "*.npz", "shuffle": True, "seed": 42}
-            dataset = S3IterableDataset(uri, loader_opts=loader_opts)
+            dataset = S3IterableDataset(uri, loader_opts=PURE_S3DLIO_LOADER_OPTS)
             return dataset
         
-        def iterate_dataset(dataset, max_items=5):
-            """Iterate through dataset items (limited to avoid long benchmarks)."""
-            items = []
-            for i, item in enumerate(dataset):
-                items.append(item)
-                if i >= max_items - 1:
-                    break
-            return items
-        
-        # Benchmark dataset creation
-        creation_time, creation_memory, dataset = benchmark_function(create_dataset)
-        
-        # Benchmark iteration
-        iteration_time, iteration_memory, items = benchmark_function(iterate_dataset, dataset, 3)
+        # Benchmark dataset creation and iteration in one measurement region
+        (creation_time, creation_memory, iteration_time, iteration_memory,
+         items_loaded, bytes_loaded) = measure_phases(create_dataset, iterate_dataset_cuda, 3)
         
-        return {
-            'framework': 'pure_s3dlio_pytorch',
-            'creation_time_s': creation_time,
-            'creation_memory_mb': creation_memory,
-            'iteration_time_s': iteration_time,
-            'iteration_memory_mb': iteration_memory,
-            'items_loaded': len(items),
-            'success': True,
-            'error': None
-        }
+        return BenchResult(
+            framework='pure_s3dlio_pytorch',
+            creation_time_s=creation_time,
+            creation_memory_mb=creation_memory,
+            iteration_time_s=iteration_time,
+            iteration_memory_mb=iteration_memory,
+            items_loaded=items_loaded,
+            bytes_loaded=bytes_loaded
+        )
         
     except Exception as e:
-        return {
-            'framework': 'pure_s3dlio_pytorch',
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return BenchResult(
+            framework='pure_s3dlio_pytorch',
+            success=False,
+            error=str(e),
+            traceback=traceback.format_exc()
+        )
 
-def benchmark_dldriver_pytorch() -> Dict[str, Any]:
+def benchmark_dldriver_pytorch() -> BenchResult:
     """Benchmark dl-driver PyTorch integration."""
-    print("🔧 Benchmarking dl-driver PyTorch...")
+    print("🔧 Benchmarking dl-driver PyTorch...", file=sys.stderr)
     
     try:
-        import torch
-        from frameworks.pytorch import DlioPyTorchDataset
+        DlioPyTorchDataset, import_error = _load_dataset_class(
+            "torch", "frameworks.pytorch", "DlioPyTorchDataset")
+        if DlioPyTorchDataset is None:
+            raise import_error
         
         def create_dataset():
-            test_config = {
-                'dataset': {
-                    'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                    'format': 'npz',
-                    'num_files_train': 10,
-                    'record_length_bytes': 1048576,
-                    'num_samples_per_file': 1
-                },
-                'reader': {
-                    'data_loader': 'pytorch',
-                    'batch_size': 4,
-                    'read_threads': 2
-                },
-                'train': {
-                    'epochs': 1,
-                    'seed': 42
-                }
-            }
-            dataset = DlioPyTorchDataset(config_dict=test_config)
-            return dataset
-        
-        def iterate_dataset(dataset, max_items=5):
-            """Iterate through dataset items (limited to avoid long benchmarks)."""
-            items = []
-            for i, item in enumerate(dataset):
-                items.append(item)
-                if i >= max_items - 1:
-                    break
-            return items
-        
-        # Benchmark dataset creation
-        creation_time, creation_memory, dataset = benchmark_function(create_dataset)
+            return DlioPyTorchDataset(config_dict=PYTORCH_BENCH_CONFIG)
         
-        # Benchmark iteration
-        iteration_time, iteration_memory, items = benchmark_function(iterate_dataset, dataset, 3)
+        # Benchmark dataset creation and iteration in one measurement region
+        (creation_time, creation_memory, iteration_time, iteration_memory,
+         items_loaded, bytes_loaded) = measure_phases(create_dataset, iterate_dataset_cuda, 3)
         
-        return {
-            'framework': 'dldriver_pytorch',
-            'creation_time_s': creation_time,
-            'creation_memory_mb': creation_memory,
-            'iteration_time_s': iteration_time,
-            'iteration_memory_mb': iteration_memory,
-            'items_loaded': len(items),
-            'success': True,
-            'error': None
-        }
+        return BenchResult(
+            framework='dldriver_pytorch',
+            creation_time_s=creation_time,
+            creation_memory_mb=creation_memory,
+            iteration_time_s=iteration_time,
+            iteration_memory_mb=iteration_memory,
+            items_loaded=items_loaded,
+            bytes_loaded=bytes_loaded
+        )
         
     except Exception as e:
-        return {
-            'framework': 'dldriver_pytorch',
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return BenchResult(
+            framework='dldriver_pytorch',
+            success=False,
+            error=str(e),
+            traceback=traceback.format_exc()
+        )
 
-def benchmark_pure_s3dlio_tensorflow() -> Dict[str, Any]:
+def benchmark_pure_s3dlio_tensorflow() -> BenchResult:
     """Benchmark pure s3dlio TensorFlow integration."""
-    print("🔧 Benchmarking pure s3dlio TensorFlow...")
+    print("🔧 Benchmarking pure s3dlio TensorFlow...", file=sys.stderr)
     
     try:
         import tensorflow as tf
@@ -172,289 +423,318 @@ def benchmark_pure_s3dlio_tensorflow() -> Dict[str, Any]:
             dataset = make_tf_dataset(uri, shuffle=True, seed=42, batch_size=2)
             return dataset
         
-        def iterate_dataset(dataset, max_items=3):
-            """Iterate through dataset items (limited)."""
-            items = []
-            for i, item in enumerate(dataset.take(max_items)):
-                items.append(item)
-            return items
-        
-        # Benchmark dataset creation
-        creation_time, creation_memory, dataset = benchmark_function(create_dataset)
+        # Benchmark dataset creation and iteration in one measurement region
+        (creation_time, creation_memory, iteration_time, iteration_memory,
+         items_loaded, bytes_loaded) = measure_phases(create_dataset, iterate_tf_dataset, 3)
         
-        # Benchmark iteration
-        iteration_time, iteration_memory, items = benchmark_function(iterate_dataset, dataset, 3)
-        
-        return {
-            'framework': 'pure_s3dlio_tensorflow',
-            'creation_time_s': creation_time,
-            'creation_memory_mb': creation_memory,
-            'iteration_time_s': iteration_time,
-            'iteration_memory_mb': iteration_memory,
-            'items_loaded': len(items),
-            'success': True,
-            'error': None
-        }
+        return BenchResult(
+            framework='pure_s3dlio_tensorflow',
+            creation_time_s=creation_time,
+            creation_memory_mb=creation_memory,
+            iteration_time_s=iteration_time,
+            iteration_memory_mb=iteration_memory,
+            items_loaded=items_loaded,
+            bytes_loaded=bytes_loaded
+        )
         
     except Exception as e:
-        return {
-            'framework': 'pure_s3dlio_tensorflow',
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return BenchResult(
+            framework='pure_s3dlio_tensorflow',
+            success=False,
+            error=str(e),
+            traceback=traceback.format_exc()
+        )
 
-def benchmark_dldriver_tensorflow() -> Dict[str, Any]:
+def benchmark_dldriver_tensorflow() -> BenchResult:
     """Benchmark dl-driver TensorFlow integration."""
-    print("🔧 Benchmarking dl-driver TensorFlow...")
+    print("🔧 Benchmarking dl-driver TensorFlow...", file=sys.stderr)
     
     try:
-        import tensorflow as tf
-        from frameworks.tensorflow import DlioTensorFlowDataset
+        DlioTensorFlowDataset, import_error = _load_dataset_class(
+            "tensorflow", "frameworks.tensorflow", "DlioTensorFlowDataset")
+        if DlioTensorFlowDataset is None:
+            raise import_error
         
         def create_dataset():
-            test_config = {
-                'dataset': {
-                    'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                    'format': 'npz',
-                    'num_files_train': 10,
-                    'record_length_bytes': 1048576,
-                    'num_samples_per_file': 1
-                },
-                'reader': {
-                    'data_loader': 'tensorflow',
-                    'batch_size': 2,
-                    'read_threads': 2
-                },
-                'train': {
-                    'epochs': 1,
-                    'seed': 42
-                }
-            }
-            tf_dataset_wrapper = DlioTensorFlowDataset(config_dict=test_config)
-            dataset = tf_dataset_wrapper.create_dataset()
-            return dataset
-        
-        def iterate_dataset(dataset, max_items=3):
-            """Iterate through dataset items (limited)."""
-            items = []
-            for i, item in enumerate(dataset.take(max_items)):
-                items.append(item)
-            return items
+            tf_dataset_wrapper = DlioTensorFlowDataset(config_dict=TENSORFLOW_BENCH_CONFIG)
+            return tf_dataset_wrapper.create_dataset()
         
-        # Benchmark dataset creation
-        creation_time, creation_memory, dataset = benchmark_function(create_dataset)
+        # Benchmark dataset creation and iteration in one measurement region
+        (creation_time, creation_memory, iteration_time, iteration_memory,
+         items_loaded, bytes_loaded) = measure_phases(create_dataset, iterate_tf_dataset, 3)
         
-        # Benchmark iteration
-        iteration_time, iteration_memory, items = benchmark_function(iterate_dataset, dataset, 3)
-        
-        return {
-            'framework': 'dldriver_tensorflow',
-            'creation_time_s': creation_time,
-            'creation_memory_mb': creation_memory,
-            'iteration_time_s': iteration_time,
-            'iteration_memory_mb': iteration_memory,
-            'items_loaded': len(items),
-            'success': True,
-            'error': None
-        }
+        return BenchResult(
+            framework='dldriver_tensorflow',
+            creation_time_s=creation_time,
+            creation_memory_mb=creation_memory,
+            iteration_time_s=iteration_time,
+            iteration_memory_mb=iteration_memory,
+            items_loaded=items_loaded,
+            bytes_loaded=bytes_loaded
+        )
         
     except Exception as e:
-        return {
-            'framework': 'dldriver_tensorflow',
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return BenchResult(
+            framework='dldriver_tensorflow',
+            success=False,
+            error=str(e),
+            traceback=traceback.format_exc()
+        )
+
+# Overheads whose pairwise-ratio IQR exceeds this fraction of the median are
+# reported as unstable rather than trusted
+OVERHEAD_MAX_RELATIVE_IQR = 0.5
 
-def calculate_overhead(pure_result: Dict[str, Any], dldriver_result: Dict[str, Any]) -> Dict[str, Any]:
-    """Calculate overhead of dl-driver vs pure s3dlio."""
-    if not (pure_result['success'] and dldriver_result['success']):
+def _pairwise_overhead(pure_values: List[float], dldriver_values: List[float]) -> Tuple[float, Tuple[float, float], bool]:
+    """
+    Overhead of dl-driver vs pure s3dlio over every (dl-driver run, pure run) pair.
+    
+    Returns:
+        Tuple of (median_overhead_percent, (q25_percent, q75_percent), stable)
+    """
+    ratios = np.divide.outer(np.asarray(dldriver_values), np.asarray(pure_values)).ravel()
+    median = float(np.median(ratios))
+    q25, q75 = np.quantile(ratios, [0.25, 0.75])
+    stable = (q75 - q25) / median <= OVERHEAD_MAX_RELATIVE_IQR
+    return (median - 1) * 100, ((q25 - 1) * 100, (q75 - 1) * 100), bool(stable)
+
+def calculate_overhead(pure_runs: List[BenchResult], dldriver_runs: List[BenchResult]) -> Dict[str, Any]:
+    """
+    Calculate overhead of dl-driver vs pure s3dlio from the raw runs.
+    
+    Time overheads are the median of all pairwise dl-driver/pure ratios, with
+    their interquartile range, so a single outlier run cannot swing the result.
+    Memory overheads are the median of the pairwise differences.
+    """
+    if not (pure_runs and dldriver_runs and all(r.success for r in pure_runs + dldriver_runs)):
         return {'error': 'One or both benchmarks failed'}
     
-    creation_overhead = ((dldriver_result['creation_time_s'] - pure_result['creation_time_s']) / pure_result['creation_time_s']) * 100
-    iteration_overhead = ((dldriver_result['iteration_time_s'] - pure_result['iteration_time_s']) / pure_result['iteration_time_s']) * 100
-    
-    memory_overhead_creation = dldriver_result['creation_memory_mb'] - pure_result['creation_memory_mb']
-    memory_overhead_iteration = dldriver_result['iteration_memory_mb'] - pure_result['iteration_memory_mb']
-    
-    return {
-        'creation_time_overhead_percent': creation_overhead,
-        'iteration_time_overhead_percent': iteration_overhead,
-        'memory_overhead_creation_mb': memory_overhead_creation,
-        'memory_overhead_iteration_mb': memory_overhead_iteration,
-        'pure_creation_time_s': pure_result['creation_time_s'],
-        'dldriver_creation_time_s': dldriver_result['creation_time_s'],
-        'pure_iteration_time_s': pure_result['iteration_time_s'],
-        'dldriver_iteration_time_s': dldriver_result['iteration_time_s']
-    }
+    overhead = {}
+    for metric, label in (('creation_time_s', 'creation'), ('iteration_time_s', 'iteration')):
+        pure_values = [getattr(r, metric) for r in pure_runs]
+        dldriver_values = [getattr(r, metric) for r in dldriver_runs]
+        median, iqr, stable = _pairwise_overhead(pure_values, dldriver_values)
+        overhead[f'{label}_time_overhead_percent'] = median
+        overhead[f'{label}_time_overhead_iqr_percent'] = iqr
+        overhead[f'{label}_time_overhead_stable'] = stable
+        overhead[f'pure_{label}_time_s'] = float(np.median(pure_values))
+        overhead[f'dldriver_{label}_time_s'] = float(np.median(dldriver_values))
+    
+    for metric, label in (('creation_memory_mb', 'creation'), ('iteration_memory_mb', 'iteration')):
+        deltas = np.subtract.outer(
+            np.asarray([getattr(r, metric) for r in dldriver_runs]),
+            np.asarray([getattr(r, metric) for r in pure_runs])
+        )
+        overhead[f'memory_overhead_{label}_mb'] = float(np.median(deltas))
+    
+    return overhead
+
+def _format_time_overhead(overhead: Dict[str, Any], label: str) -> str:
+    """Format a time overhead as 'median% (IQR q25%..q75%)', flagging unstable results."""
+    q25, q75 = overhead[f'{label}_time_overhead_iqr_percent']
+    text = f"{overhead[f'{label}_time_overhead_percent']:+.1f}% (IQR {q25:+.1f}%..{q75:+.1f}%)"
+    if not overhead[f'{label}_time_overhead_stable']:
+        text += " ⚠️  unstable"
+    return text
+
+def _run_and_pipe(benchmark_func, conn) -> None:
+    """Worker process entry point: run one benchmark and send its result back."""
+    try:
+        conn.send(benchmark_func())
+    finally:
+        conn.close()
 
-def run_multiple_benchmarks(benchmark_func, runs=3) -> List[Dict[str, Any]]:
-    """Run benchmark multiple times and return results."""
+def run_multiple_benchmarks(benchmark_func, runs=3) -> List[BenchResult]:
+    """Run benchmark multiple times, each in a fresh warm worker process, and return results."""
     results = []
     for i in range(runs):
-        print(f"   Run {i+1}/{runs}...")
-        result = benchmark_func()
+        logger.info(f"   {benchmark_func.__name__}: run {i+1}/{runs}...")
+        recv_conn, send_conn = _MP_CONTEXT.Pipe(duplex=False)
+        process = _MP_CONTEXT.Process(target=_run_and_pipe, args=(benchmark_func, send_conn))
+        process.start()
+        send_conn.close()
+        try:
+            result = recv_conn.recv()
+        except EOFError:
+            process.join()
+            result = BenchResult(
+                framework=benchmark_func.__name__,
+                success=False,
+                error=f'Benchmark process exited with code {process.exitcode}'
+            )
+        finally:
+            recv_conn.close()
+        process.join()
         results.append(result)
-        if not result['success']:
+        if not result.success:
             break
     return results
 
-def aggregate_benchmark_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Aggregate multiple benchmark runs."""
-    if not results or not all(r['success'] for r in results):
-        return {'success': False, 'error': 'Some benchmarks failed'}
-    
-    creation_times = [r['creation_time_s'] for r in results]
-    iteration_times = [r['iteration_time_s'] for r in results]
-    creation_memory = [r['creation_memory_mb'] for r in results]
-    iteration_memory = [r['iteration_memory_mb'] for r in results]
-    
-    return {
-        'success': True,
-        'runs': len(results),
-        'creation_time_s': {
-            'mean': statistics.mean(creation_times),
-            'stdev': statistics.stdev(creation_times) if len(creation_times) > 1 else 0,
-            'min': min(creation_times),
-            'max': max(creation_times)
-        },
-        'iteration_time_s': {
-            'mean': statistics.mean(iteration_times),
-            'stdev': statistics.stdev(iteration_times) if len(iteration_times) > 1 else 0,
-            'min': min(iteration_times),
-            'max': max(iteration_times)
-        },
-        'creation_memory_mb': {
-            'mean': statistics.mean(creation_memory),
-            'stdev': statistics.stdev(creation_memory) if len(creation_memory) > 1 else 0,
-            'min': min(creation_memory),
-            'max': max(creation_memory)
-        },
-        'iteration_memory_mb': {
-            'mean': statistics.mean(iteration_memory),
-            'stdev': statistics.stdev(iteration_memory) if len(iteration_memory) > 1 else 0,
-            'min': min(iteration_memory),
-            'max': max(iteration_memory)
+def aggregate_benchmark_results(results: List[BenchResult]) -> Dict[str, Any]:
+    """Aggregate multiple benchmark runs; failed runs keep their error and traceback."""
+    failures = [
+        {'framework': r.framework, 'error': r.error, 'traceback': r.traceback}
+        for r in results if not r.success
+    ]
+    if not results or failures:
+        return {'success': False, 'error': 'Some benchmarks failed', 'failures': failures}
+    
+    # One row per run, one column per metric
+    metrics = ('creation_time_s', 'iteration_time_s', 'creation_memory_mb', 'iteration_memory_mb')
+    samples = np.asarray([[getattr(r, m) for m in metrics] for r in results], dtype=np.float64)
+    
+    means = samples.mean(axis=0)
+    stdevs = samples.std(axis=0, ddof=1) if len(results) > 1 else np.zeros(len(metrics))
+    mins = samples.min(axis=0)
+    maxs = samples.max(axis=0)
+    
+    aggregated = {'success': True, 'runs': len(results)}
+    for i, metric in enumerate(metrics):
+        aggregated[metric] = {
+            'mean': float(means[i]),
+            'stdev': float(stdevs[i]),
+            'min': float(mins[i]),
+            'max': float(maxs[i])
         }
-    }
+    return aggregated
+
+@functools.lru_cache(maxsize=8)
+def _list_npz(data_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Scan data_dir for NPZ files; mtime_ns is part of the cache key so adding or removing files rescans."""
+    with os.scandir(data_dir) as entries:
+        return tuple(sorted(entry.path for entry in entries if entry.name.endswith('.npz') and entry.is_file()))
+
+def list_npz_files(data_dir: str) -> Tuple[str, ...]:
+    """Return the sorted NPZ file paths in data_dir (empty if it does not exist)."""
+    try:
+        return _list_npz(data_dir, os.stat(data_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return ()
+
+def _log_framework_report(framework: str, pure_agg: Dict[str, Any], dldriver_agg: Dict[str, Any],
+                          overhead: Optional[Dict[str, Any]]) -> None:
+    """Log the human-readable results block for one framework."""
+    logger.info(f"\n🔥 {framework.upper()} PERFORMANCE:")
+    if overhead is None:
+        logger.info(f"❌ {framework} benchmarks failed")
+        for agg in (pure_agg, dldriver_agg):
+            for failure in agg.get('failures', ()):
+                logger.info(f"  {failure['framework']}: {failure['error']}")
+                if failure['traceback']:
+                    logger.info(failure['traceback'])
+        return
+    
+    for label, agg in ((f"Pure s3dlio {framework}", pure_agg), (f"dl-driver {framework}", dldriver_agg)):
+        logger.info(f"{label}:")
+        logger.info(f"  Creation: {agg['creation_time_s']['mean']:.4f}s (±{agg['creation_time_s']['stdev']:.4f}s)")
+        logger.info(f"  Iteration: {agg['iteration_time_s']['mean']:.4f}s (±{agg['iteration_time_s']['stdev']:.4f}s)")
+        logger.info(f"  Memory: {agg['creation_memory_mb']['mean']:.2f}MB creation, {agg['iteration_memory_mb']['mean']:.2f}MB iteration")
+        logger.info("")
+    
+    logger.info(f"{framework} Overhead Analysis:")
+    logger.info(f"  Creation time overhead: {_format_time_overhead(overhead, 'creation')}")
+    logger.info(f"  Iteration time overhead: {_format_time_overhead(overhead, 'iteration')}")
+    logger.info(f"  Memory overhead: {overhead['memory_overhead_creation_mb']:+.1f}MB creation, {overhead['memory_overhead_iteration_mb']:+.1f}MB iteration")
 
 def main():
     """Run comprehensive performance benchmark tests."""
-    print("🚀 dl-driver M4 Framework Profiles - Performance Benchmark Tests")
-    print("=" * 80)
-    
-    # Check if test data exists
-    data_dir = Path('/mnt/vast1/dlio_data_generated')
-    if not data_dir.exists() or not list(data_dir.glob('*.npz')):
-        print("❌ Test data not found. Please generate test data first:")
-        print("   ./target/release/dl-driver generate --config test_data_generation_config.yaml")
-        return 1
+    parser = argparse.ArgumentParser(description="dl-driver vs pure s3dlio performance benchmarks")
+    parser.add_argument("--human", action="store_true",
+                        help="print a formatted report instead of JSON results")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="benchmark suites to run at once (default 1; more skews the overhead figures)")
+    args = parser.parse_args()
     
-    print(f"✅ Found test data: {len(list(data_dir.glob('*.npz')))} NPZ files")
-    print()
+    # In JSON mode stdout carries only the results document, so progress
+    # output goes to stderr
+    listener = _start_log_listener(sys.stdout if args.human else sys.stderr)
+    try:
+        return run_benchmarks(human=args.human, jobs=args.jobs)
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+
+def run_benchmarks(human: bool = False, jobs: int = 1):
+    """
+    Run the benchmark suites.
     
-    # PyTorch Benchmarks
-    print("🔥 PYTORCH PERFORMANCE BENCHMARKS")
-    print("-" * 50)
+    Results are written to stdout as one JSON document, or logged as a
+    formatted report when `human` is set. `jobs` suites run at once.
+    """
+    logger.info("🚀 dl-driver M4 Framework Profiles - Performance Benchmark Tests")
+    logger.info("=" * 80)
     
-    print("📊 Running pure s3dlio PyTorch benchmarks (3 runs)...")
-    pure_pytorch_results = run_multiple_benchmarks(benchmark_pure_s3dlio_pytorch, 3)
-    pure_pytorch_agg = aggregate_benchmark_results(pure_pytorch_results)
+    # Check if test data exists (one directory scan, reused for the count)
+    npz_files = list_npz_files('/mnt/vast1/dlio_data_generated')
+    if not npz_files:
+        logger.info("❌ Test data not found. Please generate test data first:")
+        logger.info("   ./target/release/dl-driver generate --config test_data_generation_config.yaml")
+        return 1
     
-    print("📊 Running dl-driver PyTorch benchmarks (3 runs)...")
-    dldriver_pytorch_results = run_multiple_benchmarks(benchmark_dldriver_pytorch, 3)
-    dldriver_pytorch_agg = aggregate_benchmark_results(dldriver_pytorch_results)
+    logger.info(f"✅ Found test data: {len(npz_files)} NPZ files")
+    logger.info("")
     
-    # TensorFlow Benchmarks
-    print("\n🔥 TENSORFLOW PERFORMANCE BENCHMARKS")
-    print("-" * 50)
+    # The overhead figures compare pure s3dlio with dl-driver timings, so by
+    # default the suites run one after another and never compete for CPU,
+    # storage bandwidth or page cache. jobs > 1 runs suites concurrently
+    # (each run is already its own worker process, see run_multiple_benchmarks);
+    # with a GPU present they stay serial to avoid CUDA context contention.
+    suites = {
+        'pure_pytorch': benchmark_pure_s3dlio_pytorch,
+        'dldriver_pytorch': benchmark_dldriver_pytorch,
+        'pure_tf': benchmark_pure_s3dlio_tensorflow,
+        'dldriver_tf': benchmark_dldriver_tensorflow,
+    }
+    max_workers = 1 if torch is not None and torch.cuda.is_available() else max(1, min(jobs, len(suites)))
+    
+    logger.info("🔥 PYTORCH & TENSORFLOW PERFORMANCE BENCHMARKS")
+    logger.info("-" * 50)
+    logger.info(f"📊 Running pure s3dlio and dl-driver benchmarks (3 runs each, {max_workers} suite(s) at a time)...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(run_multiple_benchmarks, func, 3) for name, func in suites.items()}
+        runs = {name: future.result() for name, future in futures.items()}
+    aggregated = {name: aggregate_benchmark_results(suite_runs) for name, suite_runs in runs.items()}
     
-    print("📊 Running pure s3dlio TensorFlow benchmarks (3 runs)...")
-    pure_tf_results = run_multiple_benchmarks(benchmark_pure_s3dlio_tensorflow, 3)
-    pure_tf_agg = aggregate_benchmark_results(pure_tf_results)
+    results = {}
+    for framework, pure_name, dldriver_name in (('pytorch', 'pure_pytorch', 'dldriver_pytorch'),
+                                                ('tensorflow', 'pure_tf', 'dldriver_tf')):
+        pure_agg, dldriver_agg = aggregated[pure_name], aggregated[dldriver_name]
+        overhead = None
+        if pure_agg['success'] and dldriver_agg['success']:
+            overhead = calculate_overhead(runs[pure_name], runs[dldriver_name])
+        results[framework] = {'pure': pure_agg, 'dldriver': dldriver_agg, 'overhead': overhead}
     
-    print("📊 Running dl-driver TensorFlow benchmarks (3 runs)...")
-    dldriver_tf_results = run_multiple_benchmarks(benchmark_dldriver_tensorflow, 3)
-    dldriver_tf_agg = aggregate_benchmark_results(dldriver_tf_results)
+    success_count = sum(agg['success'] for agg in aggregated.values())
+    results['success'] = success_count == len(aggregated)
+    
+    if not human:
+        json.dump(results, sys.stdout, indent=2, default=float)
+        sys.stdout.write("\n")
+        return 0 if results['success'] else 1
     
     # Results Summary
-    print("\n" + "=" * 80)
-    print("📊 PERFORMANCE BENCHMARK RESULTS")
-    print("=" * 80)
-    
-    # PyTorch Results
-    print("\n🔥 PYTORCH PERFORMANCE:")
-    if pure_pytorch_agg['success'] and dldriver_pytorch_agg['success']:
-        print("Pure s3dlio PyTorch:")
-        print(f"  Creation: {pure_pytorch_agg['creation_time_s']['mean']:.4f}s (±{pure_pytorch_agg['creation_time_s']['stdev']:.4f}s)")
-        print(f"  Iteration: {pure_pytorch_agg['iteration_time_s']['mean']:.4f}s (±{pure_pytorch_agg['iteration_time_s']['stdev']:.4f}s)")
-        print(f"  Memory: {pure_pytorch_agg['creation_memory_mb']['mean']:.2f}MB creation, {pure_pytorch_agg['iteration_memory_mb']['mean']:.2f}MB iteration")
-        
-        print("\ndl-driver PyTorch:")
-        print(f"  Creation: {dldriver_pytorch_agg['creation_time_s']['mean']:.4f}s (±{dldriver_pytorch_agg['creation_time_s']['stdev']:.4f}s)")
-        print(f"  Iteration: {dldriver_pytorch_agg['iteration_time_s']['mean']:.4f}s (±{dldriver_pytorch_agg['iteration_time_s']['stdev']:.4f}s)")
-        print(f"  Memory: {dldriver_pytorch_agg['creation_memory_mb']['mean']:.2f}MB creation, {dldriver_pytorch_agg['iteration_memory_mb']['mean']:.2f}MB iteration")
-        
-        # Calculate overhead
-        overhead_pytorch = calculate_overhead(
-            {k: v['mean'] if isinstance(v, dict) else v for k, v in pure_pytorch_agg.items()},
-            {k: v['mean'] if isinstance(v, dict) else v for k, v in dldriver_pytorch_agg.items()}
-        )
-        
-        print("\nPyTorch Overhead Analysis:")
-        print(f"  Creation time overhead: {overhead_pytorch['creation_time_overhead_percent']:+.1f}%")
-        print(f"  Iteration time overhead: {overhead_pytorch['iteration_time_overhead_percent']:+.1f}%")
-        print(f"  Memory overhead: {overhead_pytorch['memory_overhead_creation_mb']:+.1f}MB creation, {overhead_pytorch['memory_overhead_iteration_mb']:+.1f}MB iteration")
-    else:
-        print("❌ PyTorch benchmarks failed")
-    
-    # TensorFlow Results  
-    print("\n🔥 TENSORFLOW PERFORMANCE:")
-    if pure_tf_agg['success'] and dldriver_tf_agg['success']:
-        print("Pure s3dlio TensorFlow:")
-        print(f"  Creation: {pure_tf_agg['creation_time_s']['mean']:.4f}s (±{pure_tf_agg['creation_time_s']['stdev']:.4f}s)")
-        print(f"  Iteration: {pure_tf_agg['iteration_time_s']['mean']:.4f}s (±{pure_tf_agg['iteration_time_s']['stdev']:.4f}s)")
-        print(f"  Memory: {pure_tf_agg['creation_memory_mb']['mean']:.2f}MB creation, {pure_tf_agg['iteration_memory_mb']['mean']:.2f}MB iteration")
-        
-        print("\ndl-driver TensorFlow:")
-        print(f"  Creation: {dldriver_tf_agg['creation_time_s']['mean']:.4f}s (±{dldriver_tf_agg['creation_time_s']['stdev']:.4f}s)")
-        print(f"  Iteration: {dldriver_tf_agg['iteration_time_s']['mean']:.4f}s (±{dldriver_tf_agg['iteration_time_s']['stdev']:.4f}s)")
-        print(f"  Memory: {dldriver_tf_agg['creation_memory_mb']['mean']:.2f}MB creation, {dldriver_tf_agg['iteration_memory_mb']['mean']:.2f}MB iteration")
-        
-        # Calculate overhead
-        overhead_tf = calculate_overhead(
-            {k: v['mean'] if isinstance(v, dict) else v for k, v in pure_tf_agg.items()},
-            {k: v['mean'] if isinstance(v, dict) else v for k, v in dldriver_tf_agg.items()}
-        )
-        
-        print("\nTensorFlow Overhead Analysis:")
-        print(f"  Creation time overhead: {overhead_tf['creation_time_overhead_percent']:+.1f}%")
-        print(f"  Iteration time overhead: {overhead_tf['iteration_time_overhead_percent']:+.1f}%")
-        print(f"  Memory overhead: {overhead_tf['memory_overhead_creation_mb']:+.1f}MB creation, {overhead_tf['memory_overhead_iteration_mb']:+.1f}MB iteration")
-    else:
-        print("❌ TensorFlow benchmarks failed")
+    logger.info("\n" + "=" * 80)
+    logger.info("📊 PERFORMANCE BENCHMARK RESULTS")
+    logger.info("=" * 80)
+    
+    _log_framework_report("PyTorch", results['pytorch']['pure'], results['pytorch']['dldriver'],
+                          results['pytorch']['overhead'])
+    _log_framework_report("TensorFlow", results['tensorflow']['pure'], results['tensorflow']['dldriver'],
+                          results['tensorflow']['overhead'])
     
     # Overall Assessment
-    print("\n" + "=" * 80)
-    print("🎯 PERFORMANCE ASSESSMENT:")
-    print("=" * 80)
-    
-    success_count = sum([
-        pure_pytorch_agg['success'],
-        dldriver_pytorch_agg['success'], 
-        pure_tf_agg['success'],
-        dldriver_tf_agg['success']
-    ])
-    
-    if success_count == 4:
-        print("✅ All benchmarks completed successfully!")
-        print("📊 dl-driver wrapper overhead analysis complete")
-        print("🚀 Performance validation: PASSED")
+    logger.info("\n" + "=" * 80)
+    logger.info("🎯 PERFORMANCE ASSESSMENT:")
+    logger.info("=" * 80)
+    
+    if results['success']:
+        logger.info("✅ All benchmarks completed successfully!")
+        logger.info("📊 dl-driver wrapper overhead analysis complete")
+        logger.info("🚀 Performance validation: PASSED")
         return 0
     else:
-        print(f"⚠️  {4-success_count}/4 benchmarks failed")
-        print("❌ Performance validation: INCOMPLETE")
+        logger.info(f"⚠️  {len(aggregated)-success_count}/{len(aggregated)} benchmarks failed")
+        logger.info("❌ Performance validation: INCOMPLETE")
         return 1
 
 if __name__ == "__main__":
@@ -14,10 +14,40 @@ import yaml
 import numpy as np
 import subprocess
 from pathlib import Path
+from types import MappingProxyType
 
 # Add the framework path to sys.path
 sys.path.insert(0, '/home/eval/Documents/Rust-Devel/dl-driver/crates/py_api/src')
 
+# Read-only DLIO config template shared by the tests; cfg() builds each
+# test's mutable variant so the key set cannot drift between tests
+_BASE_CFG = MappingProxyType({
+    'dataset': MappingProxyType({
+        'data_folder': 'file:///mnt/vast1/dlio_data_generated',
+        'format': 'npz',
+        'num_files_train': 20,
+        'record_length_bytes': 64*1024*1024,
+        'num_samples_per_file': 1
+    }),
+    'reader': MappingProxyType({
+        'data_loader': 'pytorch',
+        'batch_size': 4,
+        'read_threads': 2
+    }),
+    'train': MappingProxyType({
+        'epochs': 1,
+        'seed': 42
+    }),
+})
+
+def cfg(batch_size=4, read_threads=2, num_files=20, **train):
+    """Build a fresh test config from the template; extra kwargs go to 'train'."""
+    return {
+        'dataset': dict(_BASE_CFG['dataset'], num_files_train=num_files),
+        'reader': dict(_BASE_CFG['reader'], batch_size=batch_size, read_threads=read_threads),
+        'train': dict(_BASE_CFG['train'], **train),
+    }
+
 def test_pytorch_imports():
     """Test that all PyTorch-related imports work with real dependencies."""
     print("🧪 Testing PyTorch imports...")
@@ -48,25 +78,7 @@ def test_pytorch_dataset_creation():
         from frameworks.pytorch import DlioPyTorchDataset
         
         # Create a minimal DLIO config for testing
-        test_config = {
-            'dataset': {
-                'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                'format': 'npz',
-                'num_files_train': 20,
-                'record_length': 64*1024*1024,
-                'num_samples_per_file': 1
-            },
-            'reader': {
-                'data_loader': 'pytorch',
-                'batch_size': 4,
-                'read_threads': 2
-            },
-            'train': {
-                'epochs': 1,
-                'computation_time': 0.01,
-                'seed': 42
-            }
-        }
+        test_config = cfg(computation_time=0.01)
         
         # Create the dataset (pass config_dict parameter correctly)
         dataset = DlioPyTorchDataset(config_dict=test_config)
@@ -93,31 +105,26 @@ def test_pytorch_dataloader():
         from frameworks.pytorch import DlioPyTorchDataset
         
         # Create config
-        test_config = {
-            'dataset': {
-                'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                'format': 'npz',
-                'num_files_train': 20,
-                'record_length': 64*1024*1024,
-                'num_samples_per_file': 1
-            },
-            'reader': {
-                'data_loader': 'pytorch',
-                'batch_size': 2,
-                'read_threads': 2
-            },
-            'train': {
-                'epochs': 1,
-                'seed': 42
-            }
-        }
+        test_config = cfg(batch_size=2)
         
         # Create dataset and regular PyTorch dataloader
         import torch
         from torch.utils.data import DataLoader
         
         dataset = DlioPyTorchDataset(config_dict=test_config)
-        dataloader = DataLoader(dataset, batch_size=2, num_workers=0)
+        # Tuned loader settings, see
+        # https://pytorch.org/tutorials/recipes/recipes/tuning_guide.html
+        # No shuffle argument: DlioPyTorchDataset is iterable-style, and
+        # DataLoader rejects shuffle=True for iterable datasets
+        num_workers = min(4, max(2, (os.cpu_count() or 2) // 2))
+        dataloader = DataLoader(
+            dataset,
+            batch_size=2,
+            num_workers=num_workers,
+            pin_memory=torch.cuda.is_available(),
+            persistent_workers=True,
+            prefetch_factor=4
+        )
         print("✅ PyTorch DataLoader created successfully")
         
         # Test iteration (just check we can get an iterator)
@@ -144,7 +151,8 @@ def test_data_loading_basic():
             print(f"❌ Data directory {data_dir} does not exist - need to generate data first")
             return False
         
-        npz_files = list(data_dir.glob('*.npz'))
+        with os.scandir(data_dir) as entries:
+            npz_files = [e.path for e in entries if e.name.endswith('.npz') and e.is_file()]
         if not npz_files:
             print("❌ No NPZ files found in data directory")
             return False
@@ -152,24 +160,7 @@ def test_data_loading_basic():
         print(f"✅ Found {len(npz_files)} NPZ files for testing")
         
         # Create config
-        test_config = {
-            'dataset': {
-                'data_folder': f'file://{data_dir}',
-                'format': 'npz',
-                'num_files_train': len(npz_files),
-                'record_length': 64*1024*1024,
-                'num_samples_per_file': 1
-            },
-            'reader': {
-                'data_loader': 'pytorch',
-                'batch_size': 1,
-                'read_threads': 1
-            },
-            'train': {
-                'epochs': 1,
-                'seed': 42
-            }
-        }
+        test_config = cfg(batch_size=1, read_threads=1, num_files=len(npz_files))
         
         # Create dataset
         dataset = DlioPyTorchDataset(config_dict=test_config)
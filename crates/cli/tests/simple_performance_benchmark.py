@@ -9,152 +9,258 @@ Focuses on configuration parsing overhead and dataset creation performance.
 
 import sys
 import os
-import time
 import traceback
-import statistics
+import json
+import hashlib
+import copy
+import timeit
+import argparse
+import numpy as np
+from array import array
+import multiprocessing
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+    orjson = None
+
 # Add the framework path to sys.path
 sys.path.insert(0, '/home/eval/Documents/Rust-Devel/dl-driver/crates/py_api/src')
+sys.path.insert(0, '/home/eval/Documents/Rust-Devel/dl-driver/target/release')
+
+# Import the framework classes once. A failed import is kept and re-raised by
+# each benchmark that needs it, so every benchmark still reports its own failure.
+try:
+    from frameworks.pytorch import DlioPyTorchDataset
+    _PYTORCH_IMPORT_ERROR = None
+except ImportError as e:
+    DlioPyTorchDataset = None
+    _PYTORCH_IMPORT_ERROR = e
+
+try:
+    from frameworks.tensorflow import DlioTensorFlowDataset, DlioJaxDataset
+    _TENSORFLOW_IMPORT_ERROR = None
+except ImportError as e:
+    DlioTensorFlowDataset = None
+    DlioJaxDataset = None
+    _TENSORFLOW_IMPORT_ERROR = e
+
+# Special schemes for the backend detection benchmark, dispatched on a
+# (2*len + first byte) & 7 perfect hash over the raw bytes instead of a
+# str.split. Unused slots are None and unknown schemes fall through.
+SCHEMES = (b'file', b's3', b'az', b'direct')
+
+def _scheme_hash(scheme: bytes) -> int:
+    return (2 * len(scheme) + scheme[0]) & 7
+
+_SCHEME_TABLE = [None] * 8
+for _idx, _scheme in enumerate(SCHEMES):
+    assert _SCHEME_TABLE[_scheme_hash(_scheme)] is None, "scheme hash collision"
+    _SCHEME_TABLE[_scheme_hash(_scheme)] = _idx
+del _idx, _scheme
+
+def uri_scheme(uri: str) -> str:
+    """Return the scheme of a URI ('' if it has none)."""
+    raw = uri.encode()
+    colon = raw.find(b':')
+    if colon <= 0:
+        return ''
+    scheme = raw[:colon]
+    idx = _SCHEME_TABLE[_scheme_hash(scheme)]
+    if idx is not None and SCHEMES[idx] == scheme:
+        return SCHEMES[idx].decode()
+    return scheme.decode()
+
+# Template for every benchmark config. Always go through _make_cfg(), which
+# deep-copies it: a shallow dict.copy() would share the nested 'reader' dict
+# between the PyTorch, TensorFlow and JAX configs.
+_BASE_CFG = {
+    'dataset': {
+        'data_folder': 'file:///mnt/vast1/dlio_data_generated',
+        'format': 'npz',
+        'num_files_train': 10,
+        'record_length_bytes': 1048576,
+        'num_samples_per_file': 1
+    },
+    'reader': {
+        'data_loader': 'pytorch',
+        'batch_size': 4,
+        'read_threads': 2
+    },
+    'train': {
+        'epochs': 1,
+        'seed': 42
+    }
+}
+
+def _make_cfg(loader: str, **dataset) -> Dict[str, Any]:
+    """Return a private copy of _BASE_CFG for `loader`, with optional dataset overrides."""
+    cfg = copy.deepcopy(_BASE_CFG)
+    cfg['reader']['data_loader'] = loader
+    cfg['dataset'].update(dataset)
+    return cfg
+
+def _cfg_key(cfg: Dict[str, Any]) -> bytes:
+    """
+    Stable 16-byte key for a config: blake2b over its canonical (sorted-key) JSON.
+    
+    Equal configs get equal keys regardless of dict insertion order, so the
+    key doubles as a dedup key and as the memoization key below.
+    """
+    if HAVE_ORJSON:
+        canonical = orjson.dumps(cfg, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(cfg, sort_keys=True, separators=(',', ':')).encode()
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+_DATASET_CACHE: Dict[Any, Any] = {}
+
+def _cached_dataset(dataset_class, config: Dict[str, Any], key: bytes = None):
+    """
+    Construct a dataset once per (class, config) and reuse it afterwards.
+    
+    Opt-in: memoization only pays off where the same config really is
+    constructed repeatedly; for one-off configs it just adds hashing.
+    Pass a precomputed _cfg_key() as `key` to skip re-serializing the config.
+    """
+    cache_key = (dataset_class, key if key is not None else _cfg_key(config))
+    dataset = _DATASET_CACHE.get(cache_key)
+    if dataset is None:
+        dataset = _DATASET_CACHE[cache_key] = dataset_class(config_dict=config)
+    return dataset
+
+def _count_npz(data_dir) -> int:
+    """Count .npz files in data_dir without building Path objects (scandir reuses d_type)."""
+    with os.scandir(data_dir) as entries:
+        return sum(1 for e in entries if e.name.endswith('.npz') and e.is_file(follow_symlinks=False))
+
+def _error_result(e: Exception) -> Dict[str, Any]:
+    """
+    Failure result for a benchmark.
+    
+    The traceback is captured as a TracebackException without source lines and
+    only rendered if someone asks for it: ''.join(result['traceback'].format()).
+    """
+    return {
+        'success': False,
+        'error': str(e),
+        'traceback': traceback.TracebackException(type(e), e, e.__traceback__, lookup_lines=False)
+    }
+
+def _time_call(func, repeat: int = 5) -> array:
+    """
+    Time a zero-argument callable with timeit.
+    
+    autorange() picks a loop count that runs for at least 0.2s, so timer
+    overhead is amortized over a C-level loop; the loop is then repeated.
+    
+    Returns:
+        array('d') of per-call time in seconds for each of the `repeat` runs
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = array('d', [0.0]) * repeat
+    for i in range(repeat):
+        times[i] = timer.timeit(number) / number
+    return times
+
+def _summarize_ms(times: array) -> Dict[str, float]:
+    """Summarize per-call times in milliseconds; min is the primary (least noisy) figure."""
+    times_ms = np.frombuffer(times, dtype=np.float64) * 1000
+    return {
+        'min_ms': float(times_ms.min()),
+        'mean_ms': float(times_ms.mean()),
+        'stdev_ms': float(times_ms.std(ddof=1)) if len(times_ms) > 1 else 0.0,
+        'max_ms': float(times_ms.max())
+    }
 
 def benchmark_config_parsing():
     """Benchmark DLIO configuration parsing overhead."""
     print("🔧 Benchmarking DLIO configuration parsing...")
     
     try:
-        from frameworks.pytorch import DlioPyTorchDataset
-        from frameworks.tensorflow import DlioTensorFlowDataset
+        if _PYTORCH_IMPORT_ERROR:
+            raise _PYTORCH_IMPORT_ERROR
+        if _TENSORFLOW_IMPORT_ERROR:
+            raise _TENSORFLOW_IMPORT_ERROR
         
         # Test configurations
-        pytorch_config = {
-            'dataset': {
-                'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                'format': 'npz',
-                'num_files_train': 10,
-                'record_length_bytes': 1048576,
-                'num_samples_per_file': 1
-            },
-            'reader': {
-                'data_loader': 'pytorch',
-                'batch_size': 4,
-                'read_threads': 2
-            },
-            'train': {
-                'epochs': 1,
-                'seed': 42
-            }
-        }
-        
-        tf_config = pytorch_config.copy()
-        tf_config['reader']['data_loader'] = 'tensorflow'
+        pytorch_config = _make_cfg('pytorch')
+        tf_config = _make_cfg('tensorflow')
         
         results = {}
         
+        # Headline: repeated, uncached construction through the real
+        # constructors, i.e. what parsing a config actually costs. The
+        # _cached_dataset hit time is reported separately; it measures the
+        # memoization, not parsing.
+        pytorch_key = _cfg_key(pytorch_config)
+        tf_key = _cfg_key(tf_config)
+        
+        # Bind the cache and constructors to locals for the timed calls
+        cached_dataset = _cached_dataset
+        pytorch_ctor = DlioPyTorchDataset
+        tf_ctor = DlioTensorFlowDataset
+        
         # Benchmark PyTorch config parsing
-        start_time = time.perf_counter()
-        for _ in range(100):  # Parse config 100 times
-            pytorch_dataset = DlioPyTorchDataset(config_dict=pytorch_config)
-        pytorch_parse_time = (time.perf_counter() - start_time) / 100
+        pytorch_parse = _summarize_ms(_time_call(lambda: pytorch_ctor(config_dict=pytorch_config)))
+        cached_dataset(pytorch_ctor, pytorch_config, pytorch_key)
+        pytorch_cache_hit_time = min(_time_call(lambda: cached_dataset(pytorch_ctor, pytorch_config, pytorch_key)))
         
         # Benchmark TensorFlow config parsing
-        start_time = time.perf_counter()
-        for _ in range(100):  # Parse config 100 times
-            tf_dataset = DlioTensorFlowDataset(config_dict=tf_config)
-        tf_parse_time = (time.perf_counter() - start_time) / 100
+        tf_parse = _summarize_ms(_time_call(lambda: tf_ctor(config_dict=tf_config)))
+        cached_dataset(tf_ctor, tf_config, tf_key)
+        tf_cache_hit_time = min(_time_call(lambda: cached_dataset(tf_ctor, tf_config, tf_key)))
         
         results = {
-            'pytorch_config_parse_time_ms': pytorch_parse_time * 1000,
-            'tensorflow_config_parse_time_ms': tf_parse_time * 1000,
+            'pytorch_config_parse': pytorch_parse,
+            'pytorch_config_cache_hit_time_ms': pytorch_cache_hit_time * 1000,
+            'tensorflow_config_parse': tf_parse,
+            'tensorflow_config_cache_hit_time_ms': tf_cache_hit_time * 1000,
             'success': True
         }
         
         return results
         
     except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return _error_result(e)
 
 def benchmark_dataset_creation():
     """Benchmark dataset object creation (without data loading)."""
     print("🔧 Benchmarking dataset object creation...")
     
     try:
-        from frameworks.pytorch import DlioPyTorchDataset
-        from frameworks.tensorflow import DlioTensorFlowDataset, DlioJaxDataset
-        
-        test_config = {
-            'dataset': {
-                'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                'format': 'npz',
-                'num_files_train': 10,
-                'record_length_bytes': 1048576,
-                'num_samples_per_file': 1
-            },
-            'reader': {
-                'data_loader': 'pytorch',
-                'batch_size': 4,
-                'read_threads': 2
-            },
-            'train': {
-                'epochs': 1,
-                'seed': 42
-            }
-        }
+        if _PYTORCH_IMPORT_ERROR:
+            raise _PYTORCH_IMPORT_ERROR
+        if _TENSORFLOW_IMPORT_ERROR:
+            raise _TENSORFLOW_IMPORT_ERROR
+        
+        test_config = _make_cfg('pytorch')
+        tf_config = _make_cfg('tensorflow')
+        jax_config = _make_cfg('jax')
         
         results = {}
-        runs = 10
-        
-        # PyTorch dataset creation
-        pytorch_times = []
-        for _ in range(runs):
-            start = time.perf_counter()
-            dataset = DlioPyTorchDataset(config_dict=test_config)
-            end = time.perf_counter()
-            pytorch_times.append(end - start)
-        
-        # TensorFlow dataset creation
-        tf_config = test_config.copy()
-        tf_config['reader']['data_loader'] = 'tensorflow'
-        tf_times = []
-        for _ in range(runs):
-            start = time.perf_counter()
-            dataset = DlioTensorFlowDataset(config_dict=tf_config)
-            end = time.perf_counter()
-            tf_times.append(end - start)
-        
-        # JAX dataset creation
-        jax_config = test_config.copy()
-        jax_config['reader']['data_loader'] = 'jax'
-        jax_times = []
-        for _ in range(runs):
-            start = time.perf_counter()
-            dataset = DlioJaxDataset(config_dict=jax_config)
-            end = time.perf_counter()
-            jax_times.append(end - start)
+        runs = 5
+        
+        # Bind the constructors to locals for the timed calls
+        pytorch_ctor = DlioPyTorchDataset
+        tf_ctor = DlioTensorFlowDataset
+        jax_ctor = DlioJaxDataset
+        
+        # Time the frameworks one after another: construction is pure Python,
+        # so running them on threads would only add GIL contention to each
+        pytorch_times = _time_call(lambda: pytorch_ctor(config_dict=test_config), runs)
+        tf_times = _time_call(lambda: tf_ctor(config_dict=tf_config), runs)
+        jax_times = _time_call(lambda: jax_ctor(config_dict=jax_config), runs)
         
         results = {
-            'pytorch_creation': {
-                'mean_ms': statistics.mean(pytorch_times) * 1000,
-                'stdev_ms': statistics.stdev(pytorch_times) * 1000 if len(pytorch_times) > 1 else 0,
-                'min_ms': min(pytorch_times) * 1000,
-                'max_ms': max(pytorch_times) * 1000
-            },
-            'tensorflow_creation': {
-                'mean_ms': statistics.mean(tf_times) * 1000,
-                'stdev_ms': statistics.stdev(tf_times) * 1000 if len(tf_times) > 1 else 0,
-                'min_ms': min(tf_times) * 1000,
-                'max_ms': max(tf_times) * 1000
-            },
-            'jax_creation': {
-                'mean_ms': statistics.mean(jax_times) * 1000,
-                'stdev_ms': statistics.stdev(jax_times) * 1000 if len(jax_times) > 1 else 0,
-                'min_ms': min(jax_times) * 1000,
-                'max_ms': max(jax_times) * 1000
-            },
+            'pytorch_creation': _summarize_ms(pytorch_times),
+            'tensorflow_creation': _summarize_ms(tf_times),
+            'jax_creation': _summarize_ms(jax_times),
             'runs': runs,
             'success': True
         }
@@ -162,18 +268,17 @@ def benchmark_dataset_creation():
         return results
         
     except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return _error_result(e)
 
 def benchmark_backend_detection():
     """Benchmark backend detection performance."""
     print("🔧 Benchmarking backend detection...")
     
     try:
-        from frameworks.pytorch import DlioPyTorchDataset
+        if _PYTORCH_IMPORT_ERROR:
+            raise _PYTORCH_IMPORT_ERROR
+        
+        pytorch_ctor = DlioPyTorchDataset
         
         uris = [
             'file:///tmp/data',
@@ -182,47 +287,46 @@ def benchmark_backend_detection():
             'direct:///tmp/data'
         ]
         
-        results = {}
+        runs = 5
         
-        for uri in uris:
-            config = {
-                'dataset': {
-                    'data_folder': uri,
-                    'format': 'npz',
-                    'num_files_train': 10,
-                    'record_length_bytes': 1048576,
-                    'num_samples_per_file': 1
-                },
-                'reader': {
-                    'data_loader': 'pytorch',
-                    'batch_size': 4,
-                    'read_threads': 2
-                },
-                'train': {
-                    'epochs': 1,
-                    'seed': 42
-                }
-            }
+        # One row of per-call times per URI, summarized column-wise below.
+        # URIs whose backend can't be reached keep a NaN row.
+        times = np.full((len(uris), runs), np.nan, dtype=np.float64)
+        errors = {}
+        
+        for i, uri in enumerate(uris):
+            config = _make_cfg('pytorch', data_folder=uri)
             
-            times = []
-            for _ in range(50):  # 50 iterations for good statistics
-                start = time.perf_counter()
-                try:
-                    dataset = DlioPyTorchDataset(config_dict=config)
-                    backend = dataset.backend_type
-                    end = time.perf_counter()
-                    times.append(end - start)
-                except Exception as e:
-                    # Expected for non-existent paths, but we still measure backend detection
-                    end = time.perf_counter()
-                    times.append(end - start)
+            # Probe once outside the timed region: a failing construction is
+            # expected for non-existent paths, and timing the exception path
+            # would measure unwinding rather than backend detection.
+            try:
+                pytorch_ctor(config_dict=config)
+            except Exception as e:
+                errors[uri] = str(e)
+                continue
             
-            scheme = uri.split('://')[0]
-            results[f'{scheme}_backend_detection'] = {
-                'mean_ms': statistics.mean(times) * 1000,
-                'stdev_ms': statistics.stdev(times) * 1000 if len(times) > 1 else 0,
-                'min_ms': min(times) * 1000,
-                'max_ms': max(times) * 1000,
+            times[i] = np.frombuffer(
+                _time_call(lambda config=config: pytorch_ctor(config_dict=config).backend_type, repeat=runs),
+                dtype=np.float64
+            )
+        
+        times_ms = times * 1000
+        mins = times_ms.min(axis=1)
+        means = times_ms.mean(axis=1)
+        stdevs = times_ms.std(axis=1, ddof=1)
+        maxs = times_ms.max(axis=1)
+        
+        results = {}
+        for i, uri in enumerate(uris):
+            if uri in errors:
+                results[f'{uri_scheme(uri)}_backend_detection'] = {'uri': uri, 'error': errors[uri]}
+                continue
+            results[f'{uri_scheme(uri)}_backend_detection'] = {
+                'min_ms': float(mins[i]),
+                'mean_ms': float(means[i]),
+                'stdev_ms': float(stdevs[i]),
+                'max_ms': float(maxs[i]),
                 'uri': uri
             }
         
@@ -230,62 +334,43 @@ def benchmark_backend_detection():
         return results
         
     except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return _error_result(e)
 
 def benchmark_config_validation():
     """Benchmark configuration validation performance."""
     print("🔧 Benchmarking configuration validation...")
     
     try:
-        import sys
-        import os
-        
-        # Import Rust config validation
-        sys.path.insert(0, '/home/eval/Documents/Rust-Devel/dl-driver/target/release')
-        
         # We'll test this by creating and parsing many different configs
-        from frameworks.pytorch import DlioPyTorchDataset
+        if _PYTORCH_IMPORT_ERROR:
+            raise _PYTORCH_IMPORT_ERROR
+        pytorch_ctor = DlioPyTorchDataset
         
         # Different config variations
         configs = []
         for batch_size in [1, 4, 8, 16, 32]:
             for read_threads in [1, 2, 4, 8]:
                 for format_type in ['npz', 'hdf5']:
-                    config = {
-                        'dataset': {
-                            'data_folder': 'file:///mnt/vast1/dlio_data_generated',
-                            'format': format_type,
-                            'num_files_train': 10,
-                            'record_length_bytes': 1048576,
-                            'num_samples_per_file': 1
-                        },
-                        'reader': {
-                            'data_loader': 'pytorch',
-                            'batch_size': batch_size,
-                            'read_threads': read_threads
-                        },
-                        'train': {
-                            'epochs': 1,
-                            'seed': 42
-                        }
-                    }
+                    config = _make_cfg('pytorch', format=format_type)
+                    config['reader'].update(batch_size=batch_size, read_threads=read_threads)
                     configs.append(config)
         
-        # Benchmark parsing all configs
-        start_time = time.perf_counter()
-        for config in configs:
-            dataset = DlioPyTorchDataset(config_dict=config)
-        end_time = time.perf_counter()
+        # Drop duplicate configs by content key; only unique ones are timed
+        generated = len(configs)
+        configs = list(dict(zip(map(_cfg_key, configs), configs)).values())
+        
+        # Benchmark parsing all configs one constructor call at a time
+        def parse_each():
+            for config in configs:
+                pytorch_ctor(config_dict=config)
         
-        total_time = end_time - start_time
+        total_time = min(_time_call(parse_each))
         per_config_time = total_time / len(configs)
         
         return {
             'total_configs': len(configs),
+            'generated_configs': generated,
+            'dedup_ratio': generated / len(configs),
             'total_time_s': total_time,
             'per_config_time_ms': per_config_time * 1000,
             'configs_per_second': len(configs) / total_time,
@@ -293,14 +378,26 @@ def benchmark_config_validation():
         }
         
     except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }
+        return _error_result(e)
+
+BENCHMARKS = {
+    "Configuration Parsing": benchmark_config_parsing,
+    "Dataset Creation": benchmark_dataset_creation,
+    "Backend Detection": benchmark_backend_detection,
+    "Config Validation": benchmark_config_validation,
+}
 
-def main():
+def main(argv=None):
     """Run simplified performance benchmark tests."""
+    parser = argparse.ArgumentParser(description="dl-driver framework profile performance benchmarks")
+    parser.add_argument('--only', action='append', choices=list(BENCHMARKS), metavar='NAME',
+                        help="run only this benchmark (repeatable)")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="stop at the first failed benchmark")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="benchmarks to run in parallel processes (default 1; more skews the timings)")
+    args = parser.parse_args(argv)
+    
     print("🚀 dl-driver M4 Framework Profiles - Performance Benchmark Tests")
     print("=" * 80)
     
@@ -309,29 +406,34 @@ def main():
     if not data_dir.exists():
         print("⚠️  Test data not found, but proceeding with configuration benchmarks...")
     else:
-        print(f"✅ Found test data: {len(list(data_dir.glob('*.npz')))} NPZ files")
+        print(f"✅ Found test data: {_count_npz(data_dir)} NPZ files")
     
     print()
     
-    benchmarks = [
-        ("Configuration Parsing", benchmark_config_parsing),
-        ("Dataset Creation", benchmark_dataset_creation),
-        ("Backend Detection", benchmark_backend_detection),
-        ("Config Validation", benchmark_config_validation),
-    ]
+    selected = {name: func for name, func in BENCHMARKS.items() if not args.only or name in args.only}
     
     results = {}
     
-    for benchmark_name, benchmark_func in benchmarks:
-        print(f"📊 Running {benchmark_name} benchmark...")
-        result = benchmark_func()
-        results[benchmark_name] = result
-        
-        if result['success']:
-            print(f"✅ {benchmark_name} benchmark completed")
-        else:
-            print(f"❌ {benchmark_name} benchmark failed: {result['error']}")
-        print()
+    # Benchmarks share no state, so they run in separate processes; results
+    # are collected in declared order so output and --fail-fast stay stable.
+    # Leaving the pool terminates its workers, so --fail-fast also stops
+    # benchmarks that are already running.
+    with multiprocessing.Pool(processes=max(1, min(args.jobs, len(selected)))) as pool:
+        pending = {name: pool.apply_async(func) for name, func in selected.items()}
+        
+        for benchmark_name, async_result in pending.items():
+            print(f"📊 Running {benchmark_name} benchmark...")
+            result = async_result.get()
+            results[benchmark_name] = result
+            
+            if result['success']:
+                print(f"✅ {benchmark_name} benchmark completed")
+            else:
+                print(f"❌ {benchmark_name} benchmark failed: {result['error']}")
+                if args.fail_fast:
+                    print()
+                    break
+            print()
     
     # Results Summary
     print("=" * 80)
@@ -339,33 +441,42 @@ def main():
     print("=" * 80)
     
     # Configuration Parsing Results
-    if results["Configuration Parsing"]['success']:
+    if results.get("Configuration Parsing", {}).get('success'):
         config_result = results["Configuration Parsing"]
         print("\n🔧 CONFIGURATION PARSING PERFORMANCE:")
-        print(f"  PyTorch config parsing: {config_result['pytorch_config_parse_time_ms']:.2f}ms per config")
-        print(f"  TensorFlow config parsing: {config_result['tensorflow_config_parse_time_ms']:.2f}ms per config")
+        print(f"  PyTorch config parsing: {config_result['pytorch_config_parse']['min_ms']:.3f}ms min "
+              f"(±{config_result['pytorch_config_parse']['stdev_ms']:.3f}ms)")
+        print(f"  TensorFlow config parsing: {config_result['tensorflow_config_parse']['min_ms']:.3f}ms min "
+              f"(±{config_result['tensorflow_config_parse']['stdev_ms']:.3f}ms)")
+        print(f"  Memoized lookup (_cached_dataset hit): "
+              f"PyTorch {config_result['pytorch_config_cache_hit_time_ms']:.4f}ms, "
+              f"TensorFlow {config_result['tensorflow_config_cache_hit_time_ms']:.4f}ms")
         
     # Dataset Creation Results
-    if results["Dataset Creation"]['success']:
+    if results.get("Dataset Creation", {}).get('success'):
         creation_result = results["Dataset Creation"]
         print("\n🏗️  DATASET CREATION PERFORMANCE:")
-        print(f"  PyTorch: {creation_result['pytorch_creation']['mean_ms']:.2f}±{creation_result['pytorch_creation']['stdev_ms']:.2f}ms")
-        print(f"  TensorFlow: {creation_result['tensorflow_creation']['mean_ms']:.2f}±{creation_result['tensorflow_creation']['stdev_ms']:.2f}ms")
-        print(f"  JAX: {creation_result['jax_creation']['mean_ms']:.2f}±{creation_result['jax_creation']['stdev_ms']:.2f}ms")
+        print(f"  PyTorch: {creation_result['pytorch_creation']['min_ms']:.3f}ms min (±{creation_result['pytorch_creation']['stdev_ms']:.3f}ms)")
+        print(f"  TensorFlow: {creation_result['tensorflow_creation']['min_ms']:.3f}ms min (±{creation_result['tensorflow_creation']['stdev_ms']:.3f}ms)")
+        print(f"  JAX: {creation_result['jax_creation']['min_ms']:.3f}ms min (±{creation_result['jax_creation']['stdev_ms']:.3f}ms)")
     
     # Backend Detection Results
-    if results["Backend Detection"]['success']:
+    if results.get("Backend Detection", {}).get('success'):
         backend_result = results["Backend Detection"]
         print("\n🔍 BACKEND DETECTION PERFORMANCE:")
         for key, value in backend_result.items():
             if key != 'success' and isinstance(value, dict):
-                print(f"  {key}: {value['mean_ms']:.2f}±{value['stdev_ms']:.2f}ms ({value['uri']})")
+                if 'error' in value:
+                    print(f"  {key}: not timed, construction failed ({value['uri']}): {value['error']}")
+                    continue
+                print(f"  {key}: {value['min_ms']:.3f}ms min (±{value['stdev_ms']:.3f}ms) ({value['uri']})")
     
     # Config Validation Results
-    if results["Config Validation"]['success']:
+    if results.get("Config Validation", {}).get('success'):
         validation_result = results["Config Validation"]
         print("\n✅ CONFIGURATION VALIDATION PERFORMANCE:")
-        print(f"  Parsed {validation_result['total_configs']} configs in {validation_result['total_time_s']:.3f}s")
+        print(f"  Parsed {validation_result['total_configs']} unique configs "
+              f"({validation_result['generated_configs']} generated) in {validation_result['total_time_s']:.3f}s")
         print(f"  Average: {validation_result['per_config_time_ms']:.2f}ms per config")
         print(f"  Throughput: {validation_result['configs_per_second']:.1f} configs/second")
     
@@ -13,36 +13,60 @@ import tempfile
 import yaml
 import numpy as np
 import subprocess
+import traceback
+import functools
+import argparse
+import multiprocessing
 from pathlib import Path
 
 # Add the framework path to sys.path
 sys.path.insert(0, '/home/eval/Documents/Rust-Devel/dl-driver/crates/py_api/src')
 
+# TensorFlow and JAX are slow to import, so import everything once here and
+# let each test check HAVE_TF instead of re-importing.
+try:
+    import tensorflow as tf
+    import jax
+    import jax.numpy as jnp
+    import s3dlio
+    from s3dlio.jax_tf import S3JaxIterable, make_tf_dataset
+    from frameworks.tensorflow import DlioTensorFlowDataset, DlioJaxDataset
+    HAVE_TF = True
+    _TF_IMPORT_ERROR = None
+except ImportError as e:
+    HAVE_TF = False
+    _TF_IMPORT_ERROR = e
+
+# s3dlio iterables and tf.data datasets are pure functions of their arguments,
+# so tests that ask for the same source share one (and one directory listing).
+# Anything measuring cold-start cost must call .cache_clear() on these first.
+@functools.lru_cache(maxsize=32)
+def _cached_jax_iter(uri, loader_opts):
+    """S3JaxIterable for `uri`; loader_opts is a tuple of sorted (key, value) items."""
+    return S3JaxIterable(uri, loader_opts=dict(loader_opts))
+
+@functools.lru_cache(maxsize=32)
+def _cached_tf_ds(uri, shuffle, seed, batch_size):
+    """make_tf_dataset for `uri` with the given options."""
+    return make_tf_dataset(uri, shuffle=shuffle, seed=seed, batch_size=batch_size)
+
 def test_tensorflow_imports():
     """Test that all TensorFlow-related imports work with real dependencies."""
     print("🧪 Testing TensorFlow imports...")
     
     try:
-        import tensorflow as tf
-        print(f"✅ TensorFlow {tf.__version__} imported successfully")
+        if not HAVE_TF:
+            raise _TF_IMPORT_ERROR
         
-        import jax
-        import jax.numpy as jnp
+        print(f"✅ TensorFlow {tf.__version__} imported successfully")
         print(f"✅ JAX {jax.__version__} imported successfully")
-        
-        import s3dlio
         print("✅ s3dlio imported successfully")
-        
-        from s3dlio.jax_tf import S3JaxIterable, make_tf_dataset
         print("✅ s3dlio TensorFlow/JAX functions imported successfully")
-        
-        from frameworks.tensorflow import DlioTensorFlowDataset, DlioJaxDataset
         print("✅ DLIO TensorFlow/JAX classes imported successfully")
         
         return True
     except Exception as e:
         print(f"❌ Import test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -51,7 +75,8 @@ def test_tensorflow_dataset_creation():
     print("\n🧪 Testing TensorFlow dataset creation...")
     
     try:
-        from frameworks.tensorflow import DlioTensorFlowDataset
+        if not HAVE_TF:
+            raise _TF_IMPORT_ERROR
         
         # Create a minimal DLIO config for testing
         test_config = {
@@ -86,7 +111,6 @@ def test_tensorflow_dataset_creation():
         return True
     except Exception as e:
         print(f"❌ TensorFlow dataset creation test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -95,8 +119,8 @@ def test_tf_data_pipeline():
     print("\n🧪 Testing tf.data.Dataset pipeline creation...")
     
     try:
-        import tensorflow as tf
-        from frameworks.tensorflow import DlioTensorFlowDataset
+        if not HAVE_TF:
+            raise _TF_IMPORT_ERROR
         
         # Create config
         test_config = {
@@ -133,7 +157,6 @@ def test_tf_data_pipeline():
         return True
     except Exception as e:
         print(f"❌ tf.data pipeline test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -142,8 +165,8 @@ def test_jax_dataset_creation():
     print("\n🧪 Testing JAX dataset creation...")
     
     try:
-        import jax
-        from frameworks.tensorflow import DlioJaxDataset
+        if not HAVE_TF:
+            raise _TF_IMPORT_ERROR
         
         # Create config
         test_config = {
@@ -170,14 +193,13 @@ def test_jax_dataset_creation():
         print("✅ DlioJaxDataset created successfully")
         
         # Test basic properties (JAX dataset wraps TensorFlow dataset)
-        print(f"   Storage backend: {jax_dataset.tf_dataset.backend_type}")
-        print(f"   Data folder: {jax_dataset.tf_dataset.data_folder}")
-        print(f"   Format type: {jax_dataset.tf_dataset.format_type}")
+        print(f"   Storage backend: {jax_dataset.backend_type}")
+        print(f"   Data folder: {jax_dataset.data_folder}")
+        print(f"   Format type: {jax_dataset.format_type}")
         
         return True
     except Exception as e:
         print(f"❌ JAX dataset creation test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -186,8 +208,8 @@ def test_s3dlio_backend_integration():
     print("\n🧪 Testing s3dlio backend integration for TensorFlow/JAX...")
     
     try:
-        import tensorflow as tf
-        from s3dlio.jax_tf import S3JaxIterable, make_tf_dataset
+        if not HAVE_TF:
+            raise _TF_IMPORT_ERROR
         
         # Test S3JaxIterable
         data_folder = '/mnt/vast1/dlio_data_generated'
@@ -196,13 +218,13 @@ def test_s3dlio_backend_integration():
             loader_opts = {"file_pattern": "*.npz", "shuffle": True, "seed": 42}
             
             # Test JAX iterable
-            jax_iterable = S3JaxIterable(uri, loader_opts=loader_opts)
+            jax_iterable = _cached_jax_iter(uri, tuple(sorted(loader_opts.items())))
             print("✅ S3JaxIterable created successfully")
             print(f"   Data folder: {data_folder}")
             print(f"   Backend type: {type(jax_iterable)}")
             
             # Test TensorFlow dataset creation
-            tf_dataset = make_tf_dataset(uri, shuffle=True, seed=42, batch_size=2)
+            tf_dataset = _cached_tf_ds(uri, True, 42, 2)
             print("✅ make_tf_dataset created tf.data.Dataset successfully")
             print(f"   TF Dataset type: {type(tf_dataset)}")
         else:
@@ -211,7 +233,6 @@ def test_s3dlio_backend_integration():
         return True
     except Exception as e:
         print(f"❌ s3dlio backend integration test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -220,7 +241,8 @@ def test_data_loading_basic():
     print("\n🧪 Testing basic data loading...")
     
     try:
-        from frameworks.tensorflow import DlioTensorFlowDataset, DlioJaxDataset
+        if not HAVE_TF:
+            raise _TF_IMPORT_ERROR
         
         # Check if our generated data exists
         data_dir = Path('/mnt/vast1/dlio_data_generated')
@@ -228,7 +250,8 @@ def test_data_loading_basic():
             print(f"❌ Data directory {data_dir} does not exist - need to generate data first")
             return False
         
-        npz_files = list(data_dir.glob('*.npz'))
+        with os.scandir(data_dir) as entries:
+            npz_files = [e.path for e in entries if e.name.endswith('.npz') and e.is_file()]
         if not npz_files:
             print("❌ No NPZ files found in data directory")
             return False
@@ -268,29 +291,49 @@ def test_data_loading_basic():
         return True
     except Exception as e:
         print(f"❌ Basic data loading test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
-def main():
+TESTS = {
+    "Import Tests": test_tensorflow_imports,
+    "TensorFlow Dataset Creation": test_tensorflow_dataset_creation,
+    "tf.data Pipeline Creation": test_tf_data_pipeline,
+    "JAX Dataset Creation": test_jax_dataset_creation,
+    "s3dlio Backend Integration": test_s3dlio_backend_integration,
+    "Basic Data Loading": test_data_loading_basic,
+}
+
+def main(argv=None):
     """Run all TensorFlow/JAX integration tests."""
+    parser = argparse.ArgumentParser(description="dl-driver TensorFlow/JAX integration tests")
+    parser.add_argument('--only', action='append', choices=list(TESTS), metavar='NAME',
+                        help="run only this test (repeatable)")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="stop at the first failed test")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="tests to run in parallel processes (default 1, one at a time)")
+    args = parser.parse_args(argv)
+    
     print("🚀 dl-driver M4 Framework Profiles - TensorFlow/JAX Integration Tests")
     print("=" * 80)
     
-    tests = [
-        ("Import Tests", test_tensorflow_imports),
-        ("TensorFlow Dataset Creation", test_tensorflow_dataset_creation),
-        ("tf.data Pipeline Creation", test_tf_data_pipeline),
-        ("JAX Dataset Creation", test_jax_dataset_creation),
-        ("s3dlio Backend Integration", test_s3dlio_backend_integration),
-        ("Basic Data Loading", test_data_loading_basic),
-    ]
+    selected = {name: func for name, func in TESTS.items() if not args.only or name in args.only}
     
+    # Tests share no state, so they run in separate processes; results are
+    # collected in declared order so the summary and --fail-fast stay stable.
+    # Leaving the pool terminates its workers, so --fail-fast also stops
+    # tests that are already running.
     results = []
-    for test_name, test_func in tests:
-        print(f"\n📋 Running {test_name}...")
-        success = test_func()
-        results.append((test_name, success))
+    with multiprocessing.Pool(processes=max(1, min(args.jobs, len(selected)))) as pool:
+        pending = {name: pool.apply_async(func) for name, func in selected.items()}
+        
+        for test_name, async_result in pending.items():
+            print(f"\n📋 Running {test_name}...")
+            success = async_result.get()
+            results.append((test_name, success))
+            
+            if not success and args.fail_fast:
+                break
     
     print("\n" + "=" * 80)
     print("📊 TEST RESULTS SUMMARY:")
@@ -28,30 +28,57 @@ Usage:
     loader = create_dataloader("s3://bucket/data/", framework="pytorch")
 """
 
+import importlib
 from typing import Optional, Dict, Any, Union
 
-try:
-    from .pytorch import (
-        DlioPyTorchDataset,
-        DlioPyTorchDataLoader, 
-        create_pytorch_dataloader,
-        create_pytorch_dataset
-    )
-    HAVE_PYTORCH = True
-except ImportError:
-    HAVE_PYTORCH = False
-
-try:
-    from .tensorflow import (
-        DlioTensorFlowDataset,
-        DlioJaxDataset,
-        create_tensorflow_dataset,
-        create_jax_iterable,
-        create_tensorflow_dataset_from_uri
-    )
-    HAVE_TENSORFLOW = True
-except ImportError:
-    HAVE_TENSORFLOW = False
+# Framework submodules are imported on first use (PEP 562 module __getattr__),
+# so importing this package, or using only one framework, doesn't pay for the
+# torch/tensorflow imports of the others.
+_LAZY_EXPORTS = {
+    'DlioPyTorchDataset': 'pytorch',
+    'DlioPyTorchDataLoader': 'pytorch',
+    'create_pytorch_dataloader': 'pytorch',
+    'create_pytorch_dataset': 'pytorch',
+    'DlioTensorFlowDataset': 'tensorflow',
+    'DlioJaxDataset': 'tensorflow',
+    'create_tensorflow_dataset': 'tensorflow',
+    'create_jax_iterable': 'tensorflow',
+    'create_tensorflow_dataset_from_uri': 'tensorflow',
+}
+
+_FRAMEWORK_MODULES: Dict[str, Any] = {}
+
+
+def _framework_module(name: str):
+    """Import a framework submodule once; None if its dependencies are missing."""
+    if name not in _FRAMEWORK_MODULES:
+        try:
+            _FRAMEWORK_MODULES[name] = importlib.import_module(f'.{name}', __name__)
+        except ImportError:
+            _FRAMEWORK_MODULES[name] = None
+    return _FRAMEWORK_MODULES[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'HAVE_PYTORCH':
+        return _framework_module('pytorch') is not None
+    if name == 'HAVE_TENSORFLOW':
+        return _framework_module('tensorflow') is not None
+    if name == '__all__':
+        return _exports()
+    
+    submodule = _LAZY_EXPORTS.get(name)
+    module = _framework_module(submodule) if submodule else None
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | {'HAVE_PYTORCH', 'HAVE_TENSORFLOW'})
 
 
 class FrameworkError(Exception):
@@ -59,6 +86,38 @@ class FrameworkError(Exception):
     pass
 
 
+def _jax_iterable_from_uri(tensorflow, data_source: str, **kwargs) -> Any:
+    """Create a JAX iterable straight from a data folder URI."""
+    config_dict = {
+        'data_folder': data_source,
+        **kwargs
+    }
+    jax_dataset = tensorflow.DlioJaxDataset(config_dict=config_dict)
+    return jax_dataset.create_iterable()
+
+
+_PYTORCH_UNAVAILABLE = "PyTorch integration not available. Install PyTorch and s3dlio."
+_TENSORFLOW_UNAVAILABLE = "TensorFlow integration not available. Install TensorFlow and s3dlio."
+_JAX_UNAVAILABLE = "JAX integration not available. Install JAX, NumPy and s3dlio."
+
+# (framework, data_source is a config file) -> (backing submodule, factory,
+# error if the submodule is unavailable). JAX uses the TensorFlow backend.
+_DATALOADER_DISPATCH = {
+    ('pytorch', True): (
+        'pytorch', lambda m, src, **kw: m.create_pytorch_dataloader(src, **kw), _PYTORCH_UNAVAILABLE),
+    ('pytorch', False): (
+        'pytorch', lambda m, src, **kw: m.DlioPyTorchDataLoader.from_uri(src, **kw), _PYTORCH_UNAVAILABLE),
+    ('tensorflow', True): (
+        'tensorflow', lambda m, src, **kw: m.create_tensorflow_dataset(src, **kw), _TENSORFLOW_UNAVAILABLE),
+    ('tensorflow', False): (
+        'tensorflow', lambda m, src, **kw: m.create_tensorflow_dataset_from_uri(src, **kw), _TENSORFLOW_UNAVAILABLE),
+    ('jax', True): (
+        'tensorflow', lambda m, src, **kw: m.create_jax_iterable(src, **kw), _JAX_UNAVAILABLE),
+    ('jax', False): (
+        'tensorflow', _jax_iterable_from_uri, _JAX_UNAVAILABLE),
+}
+
+
 def create_dataloader(
     data_source: str,
     framework: str = "pytorch",
@@ -87,43 +146,16 @@ def create_dataloader(
         # JAX from config with overrides
         iterable = create_dataloader("config.yaml", framework="jax", writable=True)
     """
-    if framework.lower() == "pytorch":
-        if not HAVE_PYTORCH:
-            raise FrameworkError("PyTorch integration not available. Install PyTorch and s3dlio.")
-        
-        # Determine if data_source is config file or URI
-        if data_source.endswith(('.yaml', '.yml', '.json')):
-            return create_pytorch_dataloader(data_source, **kwargs)
-        else:
-            from .pytorch import DlioPyTorchDataLoader
-            return DlioPyTorchDataLoader.from_uri(data_source, **kwargs)
-    
-    elif framework.lower() == "tensorflow":
-        if not HAVE_TENSORFLOW:
-            raise FrameworkError("TensorFlow integration not available. Install TensorFlow and s3dlio.")
-        
-        if data_source.endswith(('.yaml', '.yml', '.json')):
-            return create_tensorflow_dataset(data_source, **kwargs)
-        else:
-            return create_tensorflow_dataset_from_uri(data_source, **kwargs)
-    
-    elif framework.lower() == "jax":
-        if not HAVE_TENSORFLOW:  # JAX uses TensorFlow integration backend
-            raise FrameworkError("JAX integration not available. Install JAX, NumPy and s3dlio.")
-        
-        if data_source.endswith(('.yaml', '.yml', '.json')):
-            return create_jax_iterable(data_source, **kwargs)
-        else:
-            # Create JAX iterable from URI
-            config_dict = {
-                'data_folder': data_source,
-                **kwargs
-            }
-            jax_dataset = DlioJaxDataset(config_dict=config_dict)
-            return jax_dataset.create_iterable()
-    
-    else:
+    is_cfg = data_source.rpartition('.')[2] in ('yaml', 'yml', 'json')
+    entry = _DATALOADER_DISPATCH.get((framework.lower(), is_cfg))
+    if entry is None:
         raise FrameworkError(f"Unsupported framework: {framework}. Use 'pytorch', 'tensorflow', or 'jax'.")
+    
+    submodule, factory, unavailable = entry
+    module = _framework_module(submodule)
+    if module is None:
+        raise FrameworkError(unavailable)
+    return factory(module, data_source, **kwargs)
 
 
 def list_available_frameworks() -> Dict[str, bool]:
@@ -133,10 +165,11 @@ def list_available_frameworks() -> Dict[str, bool]:
     Returns:
         Dictionary mapping framework names to availability status
     """
+    have_tensorflow = _framework_module('tensorflow') is not None
     return {
-        'pytorch': HAVE_PYTORCH,
-        'tensorflow': HAVE_TENSORFLOW, 
-        'jax': HAVE_TENSORFLOW,  # JAX uses TensorFlow backend
+        'pytorch': _framework_module('pytorch') is not None,
+        'tensorflow': have_tensorflow,
+        'jax': have_tensorflow,  # JAX uses TensorFlow backend
     }
 
 
@@ -147,8 +180,9 @@ def get_framework_info() -> Dict[str, Any]:
     Returns:
         Dictionary with framework integration details
     """
+    available = list_available_frameworks()
     info = {
-        'available_frameworks': list_available_frameworks(),
+        'available_frameworks': available,
         'supported_backends': ['file', 's3', 'azure', 'directio'],
         'supported_formats': ['npz', 'hdf5', 'tfrecord'],
         'features': [
@@ -162,14 +196,14 @@ def get_framework_info() -> Dict[str, Any]:
     }
     
     # Add framework-specific details if available
-    if HAVE_PYTORCH:
+    if available['pytorch']:
         info['pytorch'] = {
             'classes': ['DlioPyTorchDataset', 'DlioPyTorchDataLoader'],
             'return_types': ['tensor', 'bytes', 'reader'],
             'features': ['IterableDataset', 'MapDataset', 'Distributed sharding']
         }
     
-    if HAVE_TENSORFLOW:
+    if available['tensorflow']:
         info['tensorflow'] = {
             'classes': ['DlioTensorFlowDataset', 'DlioJaxDataset'],
             'return_types': ['tf.Tensor', 'np.ndarray'],
@@ -180,27 +214,17 @@ def get_framework_info() -> Dict[str, Any]:
 
 
 # Export key classes and functions
-__all__ = [
+_BASE_EXPORTS = [
     'create_dataloader',
     'list_available_frameworks', 
     'get_framework_info',
     'FrameworkError',
 ]
 
-# Conditionally export framework-specific items
-if HAVE_PYTORCH:
-    __all__.extend([
-        'DlioPyTorchDataset',
-        'DlioPyTorchDataLoader',
-        'create_pytorch_dataloader', 
-        'create_pytorch_dataset',
-    ])
-
-if HAVE_TENSORFLOW:
-    __all__.extend([
-        'DlioTensorFlowDataset',
-        'DlioJaxDataset',
-        'create_tensorflow_dataset',
-        'create_jax_iterable',
-        'create_tensorflow_dataset_from_uri',
-    ])
\ No newline at end of file
+
+def _exports() -> list:
+    """__all__, computed on demand: framework-specific items only if available."""
+    available = list_available_frameworks()
+    return _BASE_EXPORTS + [
+        name for name, submodule in _LAZY_EXPORTS.items() if available[submodule]
+    ]
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2025 Russ Fellows <russ.fellows@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Helpers shared by the dl-driver framework integrations.
+
+Nothing in this module imports PyTorch, TensorFlow or JAX.
+"""
+
+import os
+import hashlib
+import pickle
+import queue
+import tempfile
+import threading
+import yaml
+from typing import Dict, Any, Optional, Iterator
+
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = yaml.CSafeLoader if hasattr(yaml, 'CSafeLoader') else yaml.SafeLoader
+
+
+def _config_cache_dir() -> str:
+    """Directory for parsed-config pickles ($XDG_CACHE_HOME/dl_driver)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'dl_driver')
+
+
+def load_yaml_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load a DLIO YAML config through a pickle cache.
+    
+    The parsed dict is pickled under _config_cache_dir(), never next to the
+    YAML, keyed by the YAML's absolute path, mtime_ns and size, so an edited
+    or restored file is re-parsed. Pickling keeps the parsed types intact.
+    Setting DL_DRIVER_NO_CONFIG_CACHE bypasses the cache; failures to read or
+    write it fall back to parsing the YAML.
+    
+    Args:
+        config_path: Path to DLIO YAML configuration file
+    
+    Returns:
+        Parsed configuration
+    """
+    if os.environ.get('DL_DRIVER_NO_CONFIG_CACHE'):
+        with open(config_path, 'r') as f:
+            return yaml.load(f, Loader=_YamlLoader)
+    
+    stat = os.stat(config_path)
+    key = f"{os.path.abspath(config_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    cache_path = os.path.join(_config_cache_dir(), hashlib.sha1(key.encode()).hexdigest() + '.pkl')
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Not writable: just skip the cache
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    
+    return config
+
+
+class BackgroundPrefetcher:
+    """
+    Iterate a source on a daemon thread, keeping up to `depth` items queued.
+    
+    s3dlio releases the GIL during its Rust I/O, so fetching upcoming items
+    overlaps with whatever the consumer does with the current one. An exception
+    raised by the source is re-raised in the consumer.
+    """
+    
+    _END = object()
+    
+    def __init__(self, source, depth: int = 4):
+        self._queue = queue.Queue(maxsize=max(1, depth))
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._producer, args=(source,), daemon=True)
+        self._thread.start()
+    
+    def _producer(self, source):
+        try:
+            for item in source:
+                if not self._put(item):
+                    return
+        except Exception as e:
+            self._error = e
+        self._put(self._END)
+    
+    def _put(self, item) -> bool:
+        # Wait in short slices so close() can release a producer blocked on a full queue
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._END:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                yield item
+        finally:
+            self.close()
+    
+    def close(self):
+        """Stop the producer thread; items still queued are dropped."""
+        self._stop.set()
@@ -18,13 +18,39 @@ and multi-format capabilities for seamless MLCommons DLIO integration.
 from __future__ import annotations
 
 import os
-import yaml
+import io
+import copy
+import json
+import struct
+import itertools
+import random
+import re
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, Iterator, Tuple
 from urllib.parse import urlparse
+from typing import Dict, Any, List, Optional, Union, Iterable, Iterator, Tuple, Callable
 
+# DlioPyTorchDataset subclasses IterableDataset, so torch is needed at class
+# definition time; the package __init__ defers importing this module instead.
 import torch
-from torch.utils.data import IterableDataset, DataLoader
+from torch.utils.data import IterableDataset, DataLoader, get_worker_info
+
+from ._common import BackgroundPrefetcher, load_yaml_config
+
+# orjson parses JSON several times faster than the stdlib when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+    np = None
 
 # Import s3dlio PyTorch classes
 try:
@@ -42,6 +68,206 @@ class DlioDataLoaderError(Exception):
     pass
 
 
+# URI prefix -> storage backend, checked in order by _detect_backend
+_BACKEND_PREFIXES = (
+    ('file://', 'file'),
+    ('s3://', 's3'),
+    ('s3a://', 's3'),
+    ('az://', 'azure'),
+    ('azure://', 'azure'),
+    ('abfs://', 'azure'),
+    ('direct://', 'directio'),
+)
+
+
+# Lowest-precedence layer of the merged pytorch_config
+_PYTORCH_DEFAULTS: Dict[str, Any] = {
+    'batch_size': 32,
+    'num_workers': 4,
+    'shuffle': True,
+    'seed': 42,
+    'prefetch_factor': 2,
+    'return_type': 'tensor',  # tensor, bytes, or reader
+    'background_prefetch': False,  # fetch ahead on a producer thread (opt-in)
+    'prefetch_depth': 4,
+    'loader_workers': 0,  # DataLoader worker processes (num_workers sizes s3dlio's readers)
+    'io_threads': 8,  # concurrent GETs per worker for s3/azure ('tensor'/'bytes' only)
+    'decode_npz': False,  # decode raw NPZ bytes into arrays (return_type 'bytes')
+    'force_process': False,  # run every sample through _process_sample
+}
+
+
+# Merged pytorch_config / s3dlio options, keyed on the frozen inputs they are
+# built from; many datasets (and every DataLoader worker) share the same ones.
+# Least recently used entries are evicted past _CONFIG_CACHE_SIZE.
+_CONFIG_CACHE_SIZE = 256
+_PYTORCH_CONFIG_CACHE: collections.OrderedDict = collections.OrderedDict()
+_S3DLIO_OPTIONS_CACHE: collections.OrderedDict = collections.OrderedDict()
+
+
+# Object suffixes of each dataset format, for filtering listed keys
+_FORMAT_SUFFIXES: Dict[str, Tuple[str, ...]] = {
+    'npz': ('.npz',),
+    'hdf5': ('.h5', '.hdf5'),
+    'tfrecord': ('.tfrecord',),
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable, order-independent form of a config value, for use as a cache key."""
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    # Tag scalars with their type so 1, 1.0 and True stay distinct keys
+    return (type(value), value)
+
+
+def _memoized(cache: collections.OrderedDict, inputs: Tuple, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return a deep copy of the result cached for `inputs`, computing it on first use.
+    
+    Inputs holding unhashable values (e.g. sets) bypass the cache.
+    """
+    try:
+        key = _freeze(inputs)
+        result = cache.get(key)
+    except TypeError:
+        return compute()
+    if result is None:
+        result = cache[key] = compute()
+        if len(cache) > _CONFIG_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    # Callers may mutate nested values; keep the cached copy pristine
+    return copy.deepcopy(result)
+
+
+def _fetch_in_order(fetch: Callable[[str], Any], keys: List[str], threads: int) -> Iterator[Any]:
+    """
+    Run fetch(key) for every key on a thread pool and yield results in key order.
+    
+    Up to 2*threads requests are kept in flight; requests not yet started are
+    cancelled if the consumer stops early.
+    """
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        try:
+            for key in keys:
+                pending.append(executor.submit(fetch, key))
+                if len(pending) >= 2 * threads:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _map_batch(batch: Any, fn: Callable[[torch.Tensor], Any]) -> Any:
+    """Apply fn to every tensor in a (possibly nested) batch."""
+    if isinstance(batch, torch.Tensor):
+        return fn(batch)
+    if isinstance(batch, (list, tuple)):
+        return type(batch)(_map_batch(b, fn) for b in batch)
+    if isinstance(batch, dict):
+        return {k: _map_batch(v, fn) for k, v in batch.items()}
+    return batch
+
+
+class _CudaPrefetcher:
+    """
+    Wrap a DataLoader so batches are copied to a CUDA device on a side stream.
+    
+    The non_blocking copy of the next (pinned) batch runs on its own stream
+    while the caller computes on the current one; the compute stream waits for
+    the copy before each batch is handed out.
+    """
+    
+    _END = object()
+    
+    def __init__(self, loader: DataLoader, device: Union[str, torch.device]):
+        self.loader = loader
+        self.device = torch.device(device)
+        self.stream = torch.cuda.Stream(device=self.device)
+    
+    def __len__(self) -> int:
+        return len(self.loader)
+    
+    def __iter__(self) -> Iterator[Any]:
+        compute_stream = torch.cuda.current_stream(self.device)
+        batches = iter(self.loader)
+        
+        def preload():
+            batch = next(batches, self._END)
+            if batch is self._END:
+                return batch
+            with torch.cuda.stream(self.stream):
+                return _map_batch(batch, lambda t: t.to(self.device, non_blocking=True))
+        
+        def hand_over(tensor):
+            # Tell the allocator the tensor is now in use on the compute stream
+            tensor.record_stream(compute_stream)
+            return tensor
+        
+        upcoming = preload()
+        while upcoming is not self._END:
+            compute_stream.wait_stream(self.stream)
+            batch = _map_batch(upcoming, hand_over)
+            upcoming = preload()
+            yield batch
+
+
+def _device_loader(loader: DataLoader, device: Optional[str]) -> Union[DataLoader, _CudaPrefetcher]:
+    """Wrap loader in a _CudaPrefetcher when a CUDA device is requested and available."""
+    if device and str(device).startswith('cuda') and torch.cuda.is_available():
+        return _CudaPrefetcher(loader, device)
+    return loader
+
+
+def _as_byte_tensor(data: Any) -> torch.Tensor:
+    """uint8 tensor over a bytes-like object, aliasing its memory when it is writable."""
+    view = memoryview(data)
+    if not view.nbytes:
+        return torch.empty(0, dtype=torch.uint8)
+    if view.readonly:
+        # Tensors are mutable, so read-only buffers (e.g. bytes) still need a copy
+        return torch.frombuffer(bytearray(view), dtype=torch.uint8)
+    return torch.frombuffer(view, dtype=torch.uint8)
+
+
+def _npz_array_header(buf: Any) -> Optional[Tuple[Any, Tuple[int, ...], bool, int, int]]:
+    """
+    Locate the first array of an uncompressed NPZ held in memory.
+    
+    Args:
+        buf: Raw NPZ file contents
+        
+    Returns:
+        (dtype, shape, fortran_order, npy_start, data_offset), or None when the
+        first member is compressed, pickled or not a .npy array
+    """
+    view = memoryview(buf)
+    if view[:4] != b'PK\x03\x04' or struct.unpack_from('<H', view, 8)[0] != 0:
+        return None
+    name_len, extra_len = struct.unpack_from('<HH', view, 26)
+    npy_start = 30 + name_len + extra_len
+    
+    f = io.BytesIO(view[npy_start:])
+    try:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    except ValueError:
+        return None
+    if dtype.hasobject:
+        return None
+    return dtype, shape, fortran_order, npy_start, npy_start + f.tell()
+
+
 class DlioPyTorchDataset(IterableDataset):
     """
     dl-driver PyTorch Dataset that wraps s3dlio with DLIO configuration support.
@@ -85,12 +311,11 @@ class DlioPyTorchDataset(IterableDataset):
         
         # Override data folder if provided
         if data_folder:
-            self.config['data_folder'] = data_folder
+            self.config = {**self.config, 'data_folder': data_folder}
         
         # Extract data folder and validate (check both top-level and DLIO structure)
-        self.data_folder = self.config.get('data_folder')
-        if not self.data_folder and 'dataset' in self.config:
-            self.data_folder = self.config['dataset'].get('data_folder')
+        dataset_config = self.config.get('dataset') or {}
+        self.data_folder = self.config.get('data_folder') or dataset_config.get('data_folder')
         if not self.data_folder:
             raise DlioDataLoaderError("data_folder must be specified in config or as parameter")
         
@@ -101,14 +326,26 @@ class DlioPyTorchDataset(IterableDataset):
         self.pytorch_config = self._get_pytorch_config(pytorch_config)
         
         # Get format configuration
-        self.format_type = self._detect_format()
+        self.format_type = self._detect_format(dataset_config)
         
         # Build s3dlio options
         self.s3dlio_options = self._build_s3dlio_options(**kwargs)
         
-        # Initialize underlying s3dlio dataset
+        # (dtype, shape, fortran_order, npy_start, data_offset, npy_header,
+        # zip_name_extra_lens) of the last NPZ decoded; DLIO samples share it,
+        # so it is parsed once
+        self._npz_hdr = None
+        self._decode_npz = bool(self.pytorch_config.get('decode_npz')) and self.format_type == 'npz'
+        if self._decode_npz and not HAVE_NUMPY:
+            raise DlioDataLoaderError("decode_npz requires numpy. Install with: pip install numpy")
+        
+        # Per-sample loop specialized once for this configuration
+        self._iter_impl = self._make_iter_impl()
+        
+        # The s3dlio dataset is created on first iteration, in the process
+        # that iterates, so the dataset pickles cheaply into DataLoader workers
         self._s3dlio_dataset = None
-        self._initialize_s3dlio_dataset()
+        self._io_threads = self._select_io_threads()
     
     def _parse_config(
         self, 
@@ -117,16 +354,20 @@ class DlioPyTorchDataset(IterableDataset):
     ) -> Dict[str, Any]:
         """Parse DLIO configuration from file or dictionary."""
         if config_path:
-            if not os.path.exists(config_path):
-                raise DlioDataLoaderError(f"Configuration file not found: {config_path}")
-            
-            with open(config_path, 'r') as f:
+            # Opening the file is the existence check; no separate stat
+            try:
                 if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-                    config = yaml.safe_load(f)
+                    config = load_yaml_config(config_path)
+                elif config_path.endswith('.json'):
+                    with open(config_path, 'rb') as f:
+                        config = _json_loads(f.read())
                 else:
                     raise DlioDataLoaderError(f"Unsupported config format: {config_path}")
+            except FileNotFoundError:
+                raise DlioDataLoaderError(f"Configuration file not found: {config_path}")
         elif config_dict:
-            config = config_dict.copy()
+            # Callers own config_dict; it is copied only if it needs overriding
+            config = config_dict
         else:
             raise DlioDataLoaderError("Either config_path or config_dict must be provided")
         
@@ -134,21 +375,22 @@ class DlioPyTorchDataset(IterableDataset):
     
     def _detect_backend(self, data_folder: str) -> str:
         """Detect storage backend from URI scheme."""
-        parsed = urlparse(data_folder)
-        scheme = parsed.scheme.lower()
-        
-        if scheme in ['s3', 's3a']:
-            return 's3'
-        elif scheme in ['az', 'azure', 'abfs']:
-            return 'azure'  
-        elif scheme == 'direct':
-            return 'directio'
-        elif scheme == 'file' or not scheme:
+        for prefix, backend in _BACKEND_PREFIXES:
+            if data_folder.startswith(prefix):
+                return backend
+        
+        # Anything else goes through urlparse, which only takes a scheme
+        # before the first '/' (so 's3:/bucket' is S3 and '/data/x://y' a path)
+        scheme = urlparse(data_folder).scheme.lower()
+        if not scheme:
             return 'file'
-        else:
-            raise DlioDataLoaderError(f"Unsupported URI scheme: {scheme}")
+        
+        for prefix, backend in _BACKEND_PREFIXES:
+            if prefix[:-3] == scheme:
+                return backend
+        raise DlioDataLoaderError(f"Unsupported URI scheme: {scheme}")
     
-    def _detect_format(self) -> str:
+    def _detect_format(self, dataset_config: Dict[str, Any]) -> str:
         """Detect data format from configuration or file extensions."""
         # Check explicit format in config
         format_type = self.config.get('format', '').lower()
@@ -160,39 +402,42 @@ class DlioPyTorchDataset(IterableDataset):
         if file_format in ['npz', 'hdf5', 'tfrecord']:
             return file_format
         
+        # DLIO configs carry it in the dataset section
+        dataset_format = dataset_config.get('format', '').lower()
+        if dataset_format in ['npz', 'hdf5', 'tfrecord']:
+            return dataset_format
+        
         # Default to NPZ (most common for ML workloads)
         return 'npz'
     
     def _get_pytorch_config(self, pytorch_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract and merge PyTorch-specific configuration."""
-        # Start with defaults
-        config = {
-            'batch_size': 32,
-            'num_workers': 4,
-            'shuffle': True,
-            'seed': 42,
-            'prefetch_factor': 2,
-            'return_type': 'tensor',  # tensor, bytes, or reader
-        }
-        
-        # Update from DLIO config framework section
-        if 'framework' in self.config:
-            framework_config = self.config['framework']
-            if 'pytorch' in framework_config:
-                config.update(framework_config['pytorch'])
-        
-        # Update from direct pytorch_config in DLIO
-        if 'pytorch_config' in self.config:
-            config.update(self.config['pytorch_config'])
-        
-        # Override with provided pytorch_config
-        if pytorch_config:
-            config.update(pytorch_config)
-        
-        return config
+        """Extract and merge PyTorch-specific configuration (memoized on its inputs)."""
+        inputs = (self.config.get('framework'), self.config.get('pytorch_config'), pytorch_config)
+        return _memoized(_PYTORCH_CONFIG_CACHE, inputs, lambda: self._merge_pytorch_config(pytorch_config))
+    
+    def _merge_pytorch_config(self, pytorch_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge PyTorch configuration over the defaults."""
+        # Lookups fall through: provided pytorch_config, DLIO pytorch_config,
+        # DLIO framework section, then the defaults
+        # DLIO configs commonly set `framework: pytorch` as a plain name
+        framework_config = self.config.get('framework')
+        if not isinstance(framework_config, dict):
+            framework_config = {}
+        return dict(collections.ChainMap(
+            pytorch_config or {},
+            self.config.get('pytorch_config') or {},
+            framework_config.get('pytorch') or {},
+            _PYTORCH_DEFAULTS,
+        ))
     
     def _build_s3dlio_options(self, **kwargs) -> Dict[str, Any]:
-        """Build s3dlio LoaderOptions from dl-driver configuration."""
+        """Build s3dlio LoaderOptions from dl-driver configuration (memoized on its inputs)."""
+        dlio_settings = {k: self.config[k] for k in ('num_readers', 'prefetch_buffer') if k in self.config}
+        inputs = (self.pytorch_config, dlio_settings, self.backend_type, kwargs)
+        return _memoized(_S3DLIO_OPTIONS_CACHE, inputs, lambda: self._compute_s3dlio_options(**kwargs))
+    
+    def _compute_s3dlio_options(self, **kwargs) -> Dict[str, Any]:
+        """Map dl-driver configuration onto s3dlio LoaderOptions."""
         options = {}
         
         # Map dl-driver config to s3dlio options
@@ -216,11 +461,55 @@ class DlioPyTorchDataset(IterableDataset):
         elif 'prefetch_factor' in self.pytorch_config:
             options['prefetch'] = self.pytorch_config['prefetch_factor']
         
+        # Batch direct I/O reads so one io_uring_enter submits many of them.
+        # SQ polling costs a kernel thread per ring, so it stays opt-in.
+        if self.backend_type == 'directio':
+            options['iouring_sqe_batch'] = kwargs.pop('iouring_batch', 32)
+            options['iouring_sq_poll'] = kwargs.pop('iouring_sq_poll', False)
+        
         # Override with direct kwargs
         options.update(kwargs)
         
         return options
     
+    def _can_list(self) -> bool:
+        """Whether _threaded_samples can stand in for S3IterableDataset."""
+        # It yields bytes or byte tensors; reader objects only come from s3dlio
+        return_type = self.pytorch_config.get('return_type', 'tensor')
+        return return_type in ('tensor', 'bytes') and hasattr(s3dlio, 'list')
+    
+    def _select_io_threads(self) -> int:
+        """Concurrent GETs for _threaded_samples, or 0 to stream through s3dlio."""
+        # Per-object GET latency dominates on remote object stores, so
+        # iterate by fanning GETs out over a thread pool there
+        io_threads = self.pytorch_config.get('io_threads', 8)
+        if self.backend_type in ('s3', 'azure') and io_threads > 1 and self._can_list():
+            return io_threads
+        return 0
+    
+    def _list_keys(self) -> List[str]:
+        """
+        List the data objects under data_folder.
+        
+        Keys are filtered with the s3dlio `pattern` option (a regex) when one
+        is configured, else by the extension of the dataset format, so
+        non-data objects under the prefix are skipped.
+        """
+        keys = s3dlio.list(self.data_folder)
+        pattern = self.s3dlio_options.get('pattern')
+        if pattern:
+            regex = re.compile(pattern)
+            data_keys = [k for k in keys if regex.search(k)]
+        else:
+            suffixes = _FORMAT_SUFFIXES.get(self.format_type, ())
+            data_keys = [k for k in keys if k.lower().endswith(suffixes)]
+        if keys and not data_keys:
+            raise DlioDataLoaderError(
+                f"No {self.format_type} objects under {self.data_folder}; "
+                f"set the s3dlio 'pattern' option to select the data objects"
+            )
+        return sorted(data_keys)
+    
     def _initialize_s3dlio_dataset(self):
         """Initialize the underlying s3dlio dataset."""
         try:
@@ -241,24 +530,124 @@ class DlioPyTorchDataset(IterableDataset):
         except Exception as e:
             raise DlioDataLoaderError(f"Failed to initialize s3dlio dataset: {e}")
     
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes build their own s3dlio dataset (and clients) on
+        # first iteration rather than unpickling the parent's
+        state = self.__dict__.copy()
+        state['_s3dlio_dataset'] = None
+        # Bound method; rebuilt on unpickling
+        del state['_iter_impl']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._iter_impl = self._make_iter_impl()
+    
+    def _threaded_samples(self, shard: int = 0, num_shards: int = 1) -> Iterator[Any]:
+        """
+        Yield objects under data_folder fetched with concurrent GETs.
+        
+        Args:
+            shard: Index of the key subset to fetch
+            num_shards: Number of disjoint key subsets (e.g. DataLoader workers)
+        """
+        # Sorted and shuffled with the shared seed, so every shard sees the
+        # same order and the subsets are disjoint
+        keys = self._list_keys()
+        if self.pytorch_config.get('shuffle'):
+            random.Random(self.pytorch_config.get('seed')).shuffle(keys)
+        keys = keys[shard::num_shards]
+        
+        as_tensor = self.pytorch_config.get('return_type', 'tensor') == 'tensor'
+        for data in _fetch_in_order(s3dlio.get, keys, max(1, self._io_threads)):
+            yield _as_byte_tensor(data) if as_tensor else data
+    
     def __iter__(self) -> Iterator[Any]:
         """Iterate over dataset samples."""
-        if not self._s3dlio_dataset:
-            raise DlioDataLoaderError("Dataset not initialized")
-        
-        try:
-            for item in self._s3dlio_dataset:
-                # Post-process based on format type
-                yield self._process_sample(item)
-        except Exception as e:
-            raise DlioDataLoaderError(f"Error during iteration: {e}")
+        # Under a multi-process DataLoader each worker lists the keys and
+        # fetches only its own share of them
+        worker_info = get_worker_info()
+        sharded = worker_info is not None and worker_info.num_workers > 1
+        
+        if self._io_threads or (sharded and self._can_list()):
+            if sharded:
+                source = self._threaded_samples(worker_info.id, worker_info.num_workers)
+            else:
+                source = self._threaded_samples()
+        else:
+            if self._s3dlio_dataset is None:
+                self._initialize_s3dlio_dataset()
+            source = self._s3dlio_dataset
+            if sharded:
+                # No listing path to split keys with: every worker streams the
+                # whole prefix and keeps every num_workers-th sample
+                source = itertools.islice(source, worker_info.id, None, worker_info.num_workers)
+        
+        # Optionally fetch ahead on a background thread so I/O overlaps the
+        # training step
+        if self.pytorch_config.get('background_prefetch', False):
+            source = BackgroundPrefetcher(source, self.pytorch_config.get('prefetch_depth', 4))
+        
+        # Errors propagate with their own type (e.g. OSError from a failed
+        # GET); only dataset setup translates them into DlioDataLoaderError
+        return self._iter_impl(source)
+    
+    def _make_iter_impl(self) -> Callable[[Iterable[Any]], Iterator[Any]]:
+        """Pick the per-sample loop for this configuration."""
+        # s3dlio and _threaded_samples (which only runs for 'tensor' and
+        # 'bytes') already honour return_type, so samples
+        # only go through _process_sample when it has work to do
+        if self._decode_npz:
+            return self._iter_npz
+        if self.pytorch_config.get('force_process'):
+            return self._iter_processed
+        return self._iter_passthrough
+    
+    def _iter_passthrough(self, source: Iterable[Any]) -> Iterator[Any]:
+        return iter(source)
+    
+    def _iter_npz(self, source: Iterable[Any]) -> Iterator[Any]:
+        decode = self._decode_npz_sample
+        bytes_like = (bytes, bytearray, memoryview)
+        for item in source:
+            yield decode(item) if isinstance(item, bytes_like) else item
+    
+    def _iter_processed(self, source: Iterable[Any]) -> Iterator[Any]:
+        process = self._process_sample
+        for item in source:
+            # Post-process based on format type
+            yield process(item)
     
     def _process_sample(self, item: Any) -> Any:
         """Process sample based on format type and return requirements."""
-        # For now, pass through s3dlio processing
-        # Future: Add format-specific parsing (NPZ, HDF5, TFRecord)
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            if self._decode_npz:
+                return self._decode_npz_sample(item)
+            if self.pytorch_config.get('return_type', 'tensor') == 'tensor':
+                return _as_byte_tensor(item)
+        # Future: Add HDF5 / TFRecord parsing
         return item
     
+    def _decode_npz_sample(self, item: Any) -> Any:
+        """Decode the first array of an NPZ sample, reusing the cached header."""
+        hdr = self._npz_hdr
+        # Same zip name/extra lengths and same .npy header bytes: same layout
+        if hdr is None or item[26:30] != hdr[6] or item[hdr[3]:hdr[4]] != hdr[5]:
+            parsed = _npz_array_header(item)
+            if parsed is None:
+                # Compressed or unusual archive: fall back to the zip reader
+                with np.load(io.BytesIO(item)) as npz:
+                    return npz[npz.files[0]]
+            _, _, _, npy_start, data_offset = parsed
+            hdr = self._npz_hdr = parsed + (bytes(item[npy_start:data_offset]), bytes(item[26:30]))
+        
+        dtype, shape, fortran_order, _, data_offset = hdr[:5]
+        count = 1
+        for dim in shape:
+            count *= dim
+        array = np.frombuffer(item, dtype=dtype, count=count, offset=data_offset)
+        return array.reshape(shape, order='F' if fortran_order else 'C')
+    
     @property
     def config_info(self) -> Dict[str, Any]:
         """Return configuration information for debugging."""
@@ -269,6 +658,40 @@ class DlioPyTorchDataset(IterableDataset):
             'pytorch_config': self.pytorch_config,
             's3dlio_options': self.s3dlio_options,
         }
+    
+    @classmethod
+    def validate_many(
+        cls,
+        configs: List[Dict[str, Any]],
+        **kwargs
+    ) -> List[DlioPyTorchDataset]:
+        """
+        Parse and validate several DLIO configurations.
+        
+        Convenience wrapper: each configuration is constructed in turn, as
+        cls(config_dict=config) would, and failures are tagged with the index
+        of the offending configuration. It is no faster than a loop.
+        
+        Args:
+            configs: DLIO configurations as dictionaries
+            **kwargs: Additional s3dlio options applied to every dataset
+            
+        Returns:
+            One dataset per configuration, in input order
+        """
+        if not HAVE_S3DLIO:
+            raise DlioDataLoaderError(
+                "s3dlio package is required for PyTorch integration. "
+                "Install with: pip install s3dlio"
+            )
+        
+        datasets = []
+        for index, config in enumerate(configs):
+            try:
+                datasets.append(cls(config_dict=config, **kwargs))
+            except DlioDataLoaderError as e:
+                raise DlioDataLoaderError(f"Invalid configuration at index {index}: {e}") from e
+        return datasets
 
 
 class DlioPyTorchDataLoader:
@@ -303,18 +726,26 @@ class DlioPyTorchDataLoader:
             pytorch_config=pytorch_config
         )
         
-        # Build DataLoader kwargs
+        # Build DataLoader kwargs. s3dlio handles I/O concurrency; extra
+        # worker processes only help CPU-bound sample decoding.
+        loader_workers = dataset.pytorch_config.get('loader_workers', 0)
         loader_kwargs = {
             'batch_size': dataset.pytorch_config.get('batch_size', 32),
-            'num_workers': 0,  # Let s3dlio handle concurrency
-            'pin_memory': dataset.pytorch_config.get('pin_memory', False),
+            'num_workers': loader_workers,
+            # Pinned host memory lets the CUDA copy run asynchronously
+            'pin_memory': dataset.pytorch_config.get('pin_memory', torch.cuda.is_available()),
             'drop_last': dataset.pytorch_config.get('drop_last', False),
         }
+        if loader_workers > 0:
+            # Keep workers (and their s3dlio clients) alive across epochs
+            loader_kwargs['persistent_workers'] = dataset.pytorch_config.get('persistent_workers', True)
+            loader_kwargs['prefetch_factor'] = dataset.pytorch_config.get('prefetch_factor', 2)
         
         if dataloader_kwargs:
             loader_kwargs.update(dataloader_kwargs)
         
-        return DataLoader(dataset, **loader_kwargs)
+        loader = DataLoader(dataset, **loader_kwargs)
+        return _device_loader(loader, dataset.pytorch_config.get('device'))
     
     @classmethod
     def from_uri(
@@ -329,11 +760,20 @@ class DlioPyTorchDataLoader:
         Args:
             data_folder: Data folder URI (s3://, file://, etc.)
             batch_size: Batch size for DataLoader
-            **kwargs: Additional configuration options
+            **kwargs: Additional configuration options; `device` (e.g. "cuda:0")
+                copies batches to that device on a side CUDA stream, and
+                `loader_workers` sets the number of DataLoader worker processes
             
         Returns:
             Configured PyTorch DataLoader
         """
+        device = kwargs.pop('device', None)
+        loader_workers = kwargs.pop('loader_workers', 0)
+        if loader_workers > 0:
+            kwargs.setdefault('persistent_workers', True)
+            kwargs.setdefault('prefetch_factor', 2)
+        kwargs.setdefault('pin_memory', torch.cuda.is_available())
+        
         config_dict = {
             'data_folder': data_folder,
             'pytorch_config': {
@@ -344,12 +784,13 @@ class DlioPyTorchDataLoader:
         
         dataset = DlioPyTorchDataset(config_dict=config_dict)
         
-        return DataLoader(
+        loader = DataLoader(
             dataset,
             batch_size=batch_size,
-            num_workers=0,  # s3dlio handles concurrency
+            num_workers=loader_workers,
             **kwargs
         )
+        return _device_loader(loader, device)
 
 
 # Convenience functions for common usage patterns
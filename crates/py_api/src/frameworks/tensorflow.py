@@ -18,18 +18,27 @@ and multi-format capabilities for seamless MLCommons DLIO integration.
 from __future__ import annotations
 
 import os
-import yaml
+import functools
+import itertools
+import importlib.util
+import collections
+import shutil
+import tempfile
+import threading
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, Iterator, Callable
 from urllib.parse import urlparse
+from typing import Dict, Any, List, Optional, Union, Iterator, Callable, Tuple
 
-# Import TensorFlow and JAX
-try:
-    import tensorflow as tf
-    HAVE_TF = True
-except ImportError:
-    HAVE_TF = False
-    tf = None
+from ._common import BackgroundPrefetcher, load_yaml_config
+
+# TensorFlow is imported by DlioTensorFlowDataset on first use, so JAX-only
+# users never load it; HAVE_TF only checks that it is installed
+HAVE_TF = importlib.util.find_spec('tensorflow') is not None
+tf = None
+
+# tf.data.AUTOTUNE, for config code that must not import TensorFlow
+_AUTOTUNE = -1
 
 try:
     import jax
@@ -63,55 +72,160 @@ class DlioTensorFlowError(Exception):
     pass
 
 
-class DlioTensorFlowDataset:
+class DlioJaxError(DlioTensorFlowError):
+    """Exception raised by dl-driver JAX integration."""
+    pass
+
+
+def _import_tf():
+    """Import TensorFlow into this module's `tf` global."""
+    global tf
+    if tf is None:
+        import tensorflow
+        tf = tensorflow
+    return tf
+
+
+# enable_op_determinism is process-wide, so it only needs calling once
+_DETERMINISM_SET = False
+
+
+def _enable_op_determinism():
+    """Enable TensorFlow op determinism on first use."""
+    global _DETERMINISM_SET
+    if not _DETERMINISM_SET:
+        tf.config.experimental.enable_op_determinism()
+        _DETERMINISM_SET = True
+
+
+# URI prefix -> storage backend, checked in order by _backend_for_uri
+_BACKEND_PREFIXES = (
+    ('file://', 'file'),
+    ('s3://', 's3'),
+    ('s3a://', 's3'),
+    ('az://', 'azure'),
+    ('azure://', 'azure'),
+    ('abfs://', 'azure'),
+    ('direct://', 'directio'),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _backend_for_uri(uri: str) -> Optional[str]:
+    """Storage backend for a URI by prefix; None if its scheme is unsupported."""
+    for prefix, backend in _BACKEND_PREFIXES:
+        if uri.startswith(prefix):
+            return backend
+    
+    # Anything else goes through urlparse, which only takes a scheme before
+    # the first '/' (so 's3:/bucket' is S3 and '/data/x://y' a path)
+    scheme = urlparse(uri).scheme.lower()
+    if not scheme:
+        return 'file'
+    
+    for prefix, backend in _BACKEND_PREFIXES:
+        if prefix[:-3] == scheme:
+            return backend
+    return None
+
+
+class _SampleCache:
     """
-    dl-driver TensorFlow Dataset factory that wraps s3dlio with DLIO configuration support.
+    Two-level cache of fetched objects, keyed by URI.
     
-    Features:
-    - DLIO YAML configuration parsing
-    - Multi-backend URI support (file://, s3://, az://, direct://)
-    - Format detection and handling (NPZ, HDF5, TFRecord)
-    - Framework-specific configuration profiles
-    - Seamless s3dlio integration with async Rust backend
-    - tf.data.Dataset generation with proper batching and shuffling
+    The most recently used objects, up to capacity_bytes, stay in memory.
+    Objects evicted from memory are spilled to files in a local directory
+    and read back from there (usually straight from the page cache), so
+    after the first epoch no object is fetched from the backend again.
+    Objects are cached as fetched, before shuffling or any per-epoch
+    randomness, so cached epochs still differ.
     """
     
-    def __init__(
+    def __init__(self, capacity_bytes: int, spill_dir: Optional[str] = None):
+        self.capacity_bytes = capacity_bytes
+        self._memory: collections.OrderedDict = collections.OrderedDict()
+        self._memory_bytes = 0
+        self._spilled: Dict[str, str] = {}
+        # Spill files go in a private directory created on first spill, under
+        # spill_dir when given, so caches sharing spill_dir never collide
+        self._spill_root = spill_dir
+        self._spill_dir: Optional[str] = None
+        self._spill_seq = itertools.count()
+        self._lock = threading.Lock()
+    
+    def get_or_put(self, key: str, fetch: Callable[[str], bytes]) -> bytes:
+        """Return the cached object for key, fetching and caching it on a miss."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+            path = self._spilled.get(key)
+        
+        if path is not None:
+            with open(path, 'rb') as f:
+                return f.read()
+        
+        data = fetch(key)
+        with self._lock:
+            evicted = self._put(key, data)
+        # Disk writes happen outside the lock
+        for old_key, old_data in evicted:
+            self._spill(old_key, old_data)
+        return data
+    
+    def _put(self, key: str, data: bytes) -> List[Tuple[str, bytes]]:
+        """Add key to memory; return the evicted (key, data) pairs that still need spilling."""
+        if key in self._memory:
+            return []
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        evicted = []
+        while self._memory_bytes > self.capacity_bytes and self._memory:
+            old_key, old_data = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old_data)
+            if old_key not in self._spilled:
+                evicted.append((old_key, old_data))
+        return evicted
+    
+    def _spill(self, key: str, data: bytes):
+        with self._lock:
+            if self._spill_dir is None:
+                # Removed with the cache
+                self._spill_dir = tempfile.mkdtemp(prefix='dl_driver_samples_', dir=self._spill_root)
+                weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+            # Unique per spill, even when the same key is spilled twice
+            path = os.path.join(self._spill_dir, f'{next(self._spill_seq)}.bin')
+        
+        # The file is complete before it is published in _spilled
+        with open(path, 'wb') as f:
+            f.write(data)
+        with self._lock:
+            self._spilled[key] = path
+
+
+class _DlioConfigBase:
+    """
+    DLIO configuration handling shared by the TensorFlow and JAX datasets.
+    
+    Parses the config, resolves data_folder, storage backend and format,
+    merges the framework section named by _framework over the subclass
+    defaults, and builds s3dlio options. Nothing here needs TensorFlow.
+    """
+    
+    # framework.<_framework> and <_framework>_config are merged over the defaults
+    _framework = 'tensorflow'
+    _error = DlioTensorFlowError
+    
+    def _init_config(
         self,
-        config_path: Optional[str] = None,
-        config_dict: Optional[Dict[str, Any]] = None,
-        data_folder: Optional[str] = None,
-        tensorflow_config: Optional[Dict[str, Any]] = None,
+        config_path: Optional[str],
+        config_dict: Optional[Dict[str, Any]],
+        data_folder: Optional[str],
+        framework_config: Optional[Dict[str, Any]],
         **kwargs
     ):
-        """
-        Initialize dl-driver TensorFlow Dataset factory.
-        
-        Args:
-            config_path: Path to DLIO YAML configuration file
-            config_dict: DLIO configuration as dictionary
-            data_folder: Override data_folder from config (URI with scheme)
-            tensorflow_config: TensorFlow-specific configuration override
-            **kwargs: Additional s3dlio options (prefetch, num_workers, etc.)
-        """
-        if not HAVE_S3DLIO:
-            raise DlioTensorFlowError(
-                "s3dlio package is required for TensorFlow integration. "
-                "Install with: pip install s3dlio"
-            )
-        
-        if not HAVE_TF:
-            raise DlioTensorFlowError(
-                "TensorFlow is required for TensorFlow integration. "
-                "Install with: pip install tensorflow"
-            )
-        
-        if not HAVE_NUMPY:
-            raise DlioTensorFlowError(
-                "NumPy is required for TensorFlow integration. "
-                "Install with: pip install numpy"
-            )
-        
+        """Set config, data_folder, backend_type, framework_config, format_type and s3dlio_options."""
         # Parse configuration
         self.config = self._parse_config(config_path, config_dict)
         
@@ -124,13 +238,13 @@ class DlioTensorFlowDataset:
         if not self.data_folder and 'dataset' in self.config:
             self.data_folder = self.config['dataset'].get('data_folder')
         if not self.data_folder:
-            raise DlioTensorFlowError("data_folder must be specified in config or as parameter")
+            raise self._error("data_folder must be specified in config or as parameter")
         
         # Parse URI scheme for backend detection
         self.backend_type = self._detect_backend(self.data_folder)
         
-        # Get TensorFlow-specific configuration
-        self.tensorflow_config = self._get_tensorflow_config(tensorflow_config)
+        # Get framework-specific configuration
+        self.framework_config = self._get_framework_config(framework_config)
         
         # Get format configuration
         self.format_type = self._detect_format()
@@ -146,35 +260,26 @@ class DlioTensorFlowDataset:
         """Parse DLIO configuration from file or dictionary."""
         if config_path:
             if not os.path.exists(config_path):
-                raise DlioTensorFlowError(f"Configuration file not found: {config_path}")
+                raise self._error(f"Configuration file not found: {config_path}")
             
-            with open(config_path, 'r') as f:
-                if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-                    config = yaml.safe_load(f)
-                else:
-                    raise DlioTensorFlowError(f"Unsupported config format: {config_path}")
+            if config_path.endswith('.yaml') or config_path.endswith('.yml'):
+                config = load_yaml_config(config_path)
+            else:
+                raise self._error(f"Unsupported config format: {config_path}")
         elif config_dict:
             config = config_dict.copy()
         else:
-            raise DlioTensorFlowError("Either config_path or config_dict must be provided")
+            raise self._error("Either config_path or config_dict must be provided")
         
         return config
     
     def _detect_backend(self, data_folder: str) -> str:
         """Detect storage backend from URI scheme."""
-        parsed = urlparse(data_folder)
-        scheme = parsed.scheme.lower()
-        
-        if scheme in ['s3', 's3a']:
-            return 's3'
-        elif scheme in ['az', 'azure', 'abfs']:
-            return 'azure'  
-        elif scheme == 'direct':
-            return 'directio'
-        elif scheme == 'file' or not scheme:
-            return 'file'
-        else:
-            raise DlioTensorFlowError(f"Unsupported URI scheme: {scheme}")
+        backend = _backend_for_uri(data_folder)
+        if backend is None:
+            scheme = urlparse(data_folder).scheme.lower()
+            raise self._error(f"Unsupported URI scheme: {scheme}")
+        return backend
     
     def _detect_format(self) -> str:
         """Detect data format from configuration or file extensions."""
@@ -191,99 +296,198 @@ class DlioTensorFlowDataset:
         # Default to NPZ (most common for ML workloads)
         return 'npz'
     
-    def _get_tensorflow_config(self, tensorflow_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract and merge TensorFlow-specific configuration."""
-        # Start with defaults
-        config = {
-            'batch_size': 32,
-            'shuffle_buffer_size': 1000,
-            'seed': 42,
-            'num_parallel_calls': tf.data.AUTOTUNE if HAVE_TF else 4,
-            'prefetch_buffer_size': tf.data.AUTOTUNE if HAVE_TF else 8,
-            'deterministic': True,
-            'writable': False,  # For NumPy array creation
-        }
-        
-        # Update from DLIO config framework section
-        if 'framework' in self.config:
-            framework_config = self.config['framework']
-            if 'tensorflow' in framework_config:
-                config.update(framework_config['tensorflow'])
-        
-        # Update from direct tensorflow_config in DLIO
-        if 'tensorflow_config' in self.config:
-            config.update(self.config['tensorflow_config'])
-        
-        # Override with provided tensorflow_config
-        if tensorflow_config:
-            config.update(tensorflow_config)
-        
-        return config
+    def _default_framework_config(self) -> Dict[str, Any]:
+        """Framework defaults, overridden by the DLIO config and caller."""
+        raise NotImplementedError
+    
+    def _get_framework_config(self, framework_config: Optional[Dict[str, Any]]) -> collections.ChainMap:
+        """Layer framework-specific configuration over the defaults, without copying."""
+        # DLIO configs commonly set `framework: <name>` as a plain string
+        framework_section = self.config.get('framework')
+        if not isinstance(framework_section, dict):
+            framework_section = {}
+        
+        # Lookups fall through: provided framework config, <framework>_config
+        # in DLIO, the DLIO framework section, then the defaults. Writes land
+        # in the leading private dict, never in a caller's dict.
+        return collections.ChainMap(
+            {},
+            framework_config or {},
+            self.config.get(f'{self._framework}_config') or {},
+            framework_section.get(self._framework) or {},
+            self._default_framework_config(),
+        )
     
     def _build_s3dlio_options(self, **kwargs) -> Dict[str, Any]:
         """Build s3dlio LoaderOptions from dl-driver configuration."""
-        options = {}
+        config = self.config
+        framework_config = self.framework_config
+        
+        # Shuffling is left to tf.data / the JAX training loop
+        options = {'shuffle': False}
         
         # Map dl-driver config to s3dlio options
-        if 'batch_size' in self.tensorflow_config:
-            options['batch_size'] = self.tensorflow_config['batch_size']
-        
-        # TensorFlow doesn't use shuffle at loader level, handled by tf.data
-        options['shuffle'] = False
-        
-        if 'seed' in self.tensorflow_config:
-            options['seed'] = self.tensorflow_config['seed']
-        
-        # Map DLIO configuration
-        if 'num_readers' in self.config:
-            options['num_workers'] = self.config['num_readers']
-        elif 'num_parallel_calls' in self.tensorflow_config:
-            calls = self.tensorflow_config['num_parallel_calls']
-            if calls != tf.data.AUTOTUNE:
-                options['num_workers'] = calls
-        
-        if 'prefetch_buffer' in self.config:
-            options['prefetch'] = self.config['prefetch_buffer']
-        elif 'prefetch_buffer_size' in self.tensorflow_config:
-            prefetch = self.tensorflow_config['prefetch_buffer_size']
-            if prefetch != tf.data.AUTOTUNE:
-                options['prefetch'] = prefetch
+        for key in ('batch_size', 'seed'):
+            if key in framework_config:
+                options[key] = framework_config[key]
+        
+        # Map DLIO configuration; AUTOTUNE leaves the choice to s3dlio
+        calls = config.get('num_readers', framework_config.get('num_parallel_calls', _AUTOTUNE))
+        if calls != _AUTOTUNE:
+            options['num_workers'] = calls
+        
+        prefetch = config.get('prefetch_buffer', framework_config.get('prefetch_buffer_size', _AUTOTUNE))
+        if prefetch != _AUTOTUNE:
+            options['prefetch'] = prefetch
         
         # Override with direct kwargs
         options.update(kwargs)
         
         return options
+
+
+class DlioTensorFlowDataset(_DlioConfigBase):
+    """
+    dl-driver TensorFlow Dataset factory that wraps s3dlio with DLIO configuration support.
+    
+    Features:
+    - DLIO YAML configuration parsing
+    - Multi-backend URI support (file://, s3://, az://, direct://)
+    - Format detection and handling (NPZ, HDF5, TFRecord)
+    - Framework-specific configuration profiles
+    - Seamless s3dlio integration with async Rust backend
+    - tf.data.Dataset generation with proper batching and shuffling
+    
+    Samples are batched with batch(), never padded: objects in a batch must
+    decode to the same length, and a batch that mixes lengths raises an
+    error instead of being silently zero-padded.
+    """
+    
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        config_dict: Optional[Dict[str, Any]] = None,
+        data_folder: Optional[str] = None,
+        tensorflow_config: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        """
+        Initialize dl-driver TensorFlow Dataset factory.
+        
+        Args:
+            config_path: Path to DLIO YAML configuration file
+            config_dict: DLIO configuration as dictionary
+            data_folder: Override data_folder from config (URI with scheme)
+            tensorflow_config: TensorFlow-specific configuration override
+            **kwargs: Additional s3dlio options (prefetch, num_workers, etc.)
+        """
+        if not HAVE_S3DLIO:
+            raise DlioTensorFlowError(
+                "s3dlio package is required for TensorFlow integration. "
+                "Install with: pip install s3dlio"
+            )
+        
+        if not HAVE_TF:
+            raise DlioTensorFlowError(
+                "TensorFlow is required for TensorFlow integration. "
+                "Install with: pip install tensorflow"
+            )
+        
+        if not HAVE_NUMPY:
+            raise DlioTensorFlowError(
+                "NumPy is required for TensorFlow integration. "
+                "Install with: pip install numpy"
+            )
+        
+        _import_tf()
+        
+        self._init_config(config_path, config_dict, data_folder, tensorflow_config, **kwargs)
+        self.tensorflow_config = self.framework_config
+        
+        # Threads available to ops, including the tf.py_function reads that
+        # run concurrently while s3dlio has the GIL released
+        intra_op_threads = self.tensorflow_config.get('intra_op_threads')
+        if intra_op_threads and tf.config.threading.get_intra_op_parallelism_threads() != intra_op_threads:
+            try:
+                tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+            except RuntimeError as e:
+                raise DlioTensorFlowError(
+                    f"intra_op_threads must be set before TensorFlow is initialized: {e}"
+                )
+        
+        # Optional RAM + local-disk cache under the tf.data pipeline
+        cache_bytes = self.tensorflow_config.get('sample_cache_bytes', 0)
+        self._sample_cache = (
+            _SampleCache(cache_bytes, self.tensorflow_config.get('sample_cache_dir'))
+            if cache_bytes > 0 else None
+        )
+        
+        # DLIO's record length is the size of one sample, not of one object:
+        # an object may hold several samples plus format headers (NPZ, HDF5).
+        # Only with raw_records set, i.e. each object is exactly one raw
+        # sample, is it used as the object size; it is then static and every
+        # object's length is checked against it on decode.
+        dataset_config = self.config.get('dataset') or {}
+        self.record_size = None
+        if self.tensorflow_config.get('raw_records'):
+            self.record_size = dataset_config.get('record_length_bytes') or dataset_config.get('record_length')
+            if not self.record_size:
+                raise DlioTensorFlowError("raw_records requires dataset.record_length_bytes")
+            if dataset_config.get('num_samples_per_file', 1) != 1:
+                raise DlioTensorFlowError("raw_records requires dataset.num_samples_per_file == 1")
+        
+        # Whole objects (NPZ, HDF5, ...) are plain bytes; only a raw record
+        # is reinterpreted as the dataset's dtype
+        self.dtype = tf.uint8
+        if self.record_size:
+            try:
+                self.dtype = tf.as_dtype(dataset_config.get('dtype', 'uint8'))
+            except TypeError as e:
+                raise DlioTensorFlowError(f"Unsupported dataset dtype: {e}")
+            if self.record_size % self.dtype.size:
+                raise DlioTensorFlowError(
+                    f"record length {self.record_size} is not a multiple of the {self.dtype.name} size"
+                )
+    
+    def _default_framework_config(self) -> Dict[str, Any]:
+        """TensorFlow defaults, overridden by the DLIO config and caller."""
+        return {
+            'batch_size': 32,
+            'shuffle_buffer_size': 1000,
+            'seed': 42,
+            'num_parallel_calls': tf.data.AUTOTUNE,
+            'prefetch_buffer_size': tf.data.AUTOTUNE,
+            'deterministic': True,
+            'deterministic_reads': None,  # Read-completion order; None follows deterministic
+            'intra_op_threads': None,  # tf intra-op thread pool size (None: TensorFlow default)
+            'writable': False,  # For NumPy array creation (S3JaxIterable fallback only)
+            'cache': False,  # Keep fetched samples after the first epoch
+            'cache_path': None,  # None caches in memory, a path caches on disk
+            'num_epochs': None,  # Repeat the data this many times (-1: forever)
+            'sample_cache_bytes': 0,  # Memory for _SampleCache; 0 disables it
+            'raw_records': False,  # Each object is one raw sample of dataset.record_length_bytes
+            'sample_cache_dir': None,  # Parent of the private spill directory (default: system temp dir)
+        }
     
     def create_dataset(self) -> 'tf.data.Dataset':
         """
         Create tf.data.Dataset using s3dlio backend.
         
+        Object URIs are listed once up front and grouped s3dlio_options
+        batch_size at a time; each group is fetched by one Python call, and
+        s3dlio_options num_workers groups are interleaved on tf.data's own
+        thread pool, so several reads are in flight at once instead of one
+        Python generator. s3dlio builds without a listing API stream the
+        objects through S3JaxIterable instead.
+        
         Returns:
             Configured tf.data.Dataset
         """
         try:
-            # Create s3dlio dataset factory
-            def data_generator():
-                """Generator function for tf.data.Dataset.from_generator."""
-                # Use s3dlio's JAX iterable for NumPy arrays
-                jax_iterable = S3JaxIterable.from_prefix(
-                    uri=self.data_folder,
-                    writable=self.tensorflow_config.get('writable', False),
-                    **self.s3dlio_options
-                )
-                
-                for data_bytes in jax_iterable:
-                    # Process sample based on format type
-                    yield self._process_sample(data_bytes)
-            
-            # Determine output signature based on format
-            output_signature = self._get_output_signature()
-            
-            # Create tf.data.Dataset from generator
-            dataset = tf.data.Dataset.from_generator(
-                data_generator,
-                output_signature=output_signature
-            )
+            if hasattr(s3dlio, 'list'):
+                dataset = self._listed_dataset()
+            else:
+                dataset = self._streamed_dataset()
             
             # Apply TensorFlow-specific optimizations
             dataset = self._apply_tf_optimizations(dataset)
@@ -293,25 +497,80 @@ class DlioTensorFlowDataset:
         except Exception as e:
             raise DlioTensorFlowError(f"Failed to create TensorFlow dataset: {e}")
     
-    def _process_sample(self, data: Any) -> Any:
-        """Process sample based on format type and return requirements."""
-        # For now, return NumPy array as-is
-        # Future: Add format-specific parsing (NPZ, HDF5, TFRecord)
-        if isinstance(data, np.ndarray):
-            return data
-        elif isinstance(data, bytes):
-            # Convert bytes to uint8 tensor
-            return np.frombuffer(data, dtype=np.uint8)
-        else:
-            return data
+    def _listed_dataset(self) -> 'tf.data.Dataset':
+        """Raw object bytes, fetched in interleaved groups of listed URIs."""
+        filenames = tf.data.Dataset.from_tensor_slices(
+            tf.constant(self._list_uris(), dtype=tf.string)
+        )
+        filenames = filenames.batch(max(1, self.s3dlio_options.get('batch_size', 1)))
+        
+        # With deterministic_reads off, groups are emitted as they complete,
+        # so a slow object doesn't hold up groups that are already fetched
+        deterministic_reads = self.tensorflow_config.get('deterministic_reads')
+        if deterministic_reads is None:
+            deterministic_reads = self.tensorflow_config.get('deterministic', True)
+        
+        return filenames.interleave(
+            self._read_uri_dataset,
+            cycle_length=self.s3dlio_options.get('num_workers', 8),
+            num_parallel_calls=tf.data.AUTOTUNE,
+            deterministic=deterministic_reads
+        )
+    
+    def _streamed_dataset(self) -> 'tf.data.Dataset':
+        """Raw object bytes streamed through S3JaxIterable, for s3dlio without list()."""
+        def data_generator():
+            jax_iterable = S3JaxIterable.from_prefix(
+                uri=self.data_folder,
+                writable=self.tensorflow_config.get('writable', False),
+                **self.s3dlio_options
+            )
+            for data in jax_iterable:
+                yield data.tobytes() if isinstance(data, np.ndarray) else bytes(data)
+        
+        return tf.data.Dataset.from_generator(
+            data_generator,
+            output_signature=tf.TensorSpec(shape=(), dtype=tf.string)
+        )
+    
+    def _list_uris(self) -> List[str]:
+        """List object URIs under data_folder with a single s3dlio listing call."""
+        return list(s3dlio.list(self.data_folder))
+    
+    def _read_objects(self, uris: 'tf.Tensor') -> List[bytes]:
+        """Fetch a group of objects through s3dlio (runs inside tf.py_function)."""
+        cache = self._sample_cache
+        fetch = self._fetch_object
+        if cache is not None:
+            return [cache.get_or_put(uri.decode(), fetch) for uri in uris.numpy()]
+        return [fetch(uri.decode()) for uri in uris.numpy()]
+    
+    def _fetch_object(self, uri: str) -> bytes:
+        return bytes(s3dlio.get(uri))
+    
+    def _read_uri_dataset(self, uris: 'tf.Tensor') -> 'tf.data.Dataset':
+        """Dataset of the raw bytes of each object in a group of URIs."""
+        data = tf.py_function(self._read_objects, [uris], Tout=tf.string)
+        data.set_shape((None,))
+        return tf.data.Dataset.from_tensor_slices(data)
     
     def _get_output_signature(self) -> tf.TensorSpec:
-        """Get output signature for tf.data.Dataset.from_generator."""
-        # Default to variable-length uint8 tensor
+        """Get the spec of one decoded sample."""
+        # Static length when objects are raw records of a known size, so
+        # tf.data can preallocate batch buffers; otherwise variable-length
+        if self.record_size:
+            return tf.TensorSpec(shape=(self.record_size // self.dtype.size,), dtype=self.dtype)
         return tf.TensorSpec(shape=(None,), dtype=tf.uint8)
     
     def _apply_tf_optimizations(self, dataset: 'tf.data.Dataset') -> 'tf.data.Dataset':
         """Apply TensorFlow-specific optimizations and configurations."""
+        # Cache fetched samples so later epochs skip the backend. This sits
+        # before shuffle so each epoch is still shuffled differently. The
+        # in-memory cache needs the whole dataset to fit in RAM; set
+        # cache_path to a local file prefix for larger datasets.
+        if self.tensorflow_config.get('cache'):
+            dataset = dataset.cache(self.tensorflow_config.get('cache_path') or '')
+        
         # Apply shuffling if configured
         if self.tensorflow_config.get('shuffle_buffer_size'):
             dataset = dataset.shuffle(
@@ -320,23 +579,69 @@ class DlioTensorFlowDataset:
                 reshuffle_each_iteration=True
             )
         
-        # Apply batching
+        # Repeat after shuffle and before batch, so batches span epoch
+        # boundaries and each epoch gets its own shuffle order
+        if self.tensorflow_config.get('num_epochs'):
+            dataset = dataset.repeat(self.tensorflow_config['num_epochs'])
+        
+        sample_spec = self._get_output_signature()
+        deterministic = self.tensorflow_config.get('deterministic', True)
+        
+        # Without a known record size, objects may differ in length: decode
+        # each one on its own before batching. batch() then fails on a batch
+        # of mismatched lengths rather than padding it.
+        if not self.record_size:
+            dataset = dataset.map(
+                lambda data: tf.io.decode_raw(data, sample_spec.dtype),
+                num_parallel_calls=tf.data.AUTOTUNE,
+                deterministic=deterministic
+            )
+        
+        # Apply batching. The final partial batch is kept unless drop_last
+        # is set; only then is the batch dimension static.
+        element_shape = sample_spec.shape
         if self.tensorflow_config.get('batch_size', 1) > 1:
+            drop_remainder = self.tensorflow_config.get('drop_last', False)
             dataset = dataset.batch(
                 self.tensorflow_config['batch_size'],
-                drop_remainder=self.tensorflow_config.get('drop_last', False),
-                deterministic=self.tensorflow_config.get('deterministic', True)
+                drop_remainder=drop_remainder,
+                deterministic=deterministic
+            )
+            batch_dim = self.tensorflow_config['batch_size'] if drop_remainder else None
+            element_shape = tf.TensorShape([batch_dim]).concatenate(element_shape)
+        
+        # Raw records are decoded once per batch rather than per sample.
+        # Decoding fails on any object whose size isn't the record size
+        # (ensure_shape) instead of silently truncating or padding it.
+        if self.record_size:
+            dataset = dataset.map(
+                lambda data: tf.ensure_shape(tf.io.decode_raw(data, sample_spec.dtype), element_shape),
+                num_parallel_calls=tf.data.AUTOTUNE,
+                deterministic=deterministic
             )
         
-        # Apply prefetching
-        if self.tensorflow_config.get('prefetch_buffer_size'):
-            dataset = dataset.prefetch(self.tensorflow_config['prefetch_buffer_size'])
+        # Always end with prefetch so fetching overlaps the training step; a
+        # positive integer s3dlio_options prefetch (DLIO prefetch_buffer,
+        # prefetch_buffer_size or a prefetch kwarg) overrides AUTOTUNE
+        prefetch = self.s3dlio_options.get('prefetch')
+        if not isinstance(prefetch, int) or prefetch <= 0:
+            prefetch = tf.data.AUTOTUNE
+        dataset = dataset.prefetch(prefetch)
         
         # Set deterministic behavior
         if self.tensorflow_config.get('deterministic', True):
-            tf.config.experimental.enable_op_determinism()
-        
-        return dataset
+            _enable_op_determinism()
+        
+        # Let tf.data's static rewrites fuse and parallelize the pipeline;
+        # per-transform deterministic arguments above still take precedence
+        options = tf.data.Options()
+        options.experimental_optimization.map_and_batch_fusion = True
+        options.experimental_optimization.map_parallelization = True
+        options.experimental_optimization.parallel_batch = True
+        options.autotune.enabled = True
+        options.deterministic = self.tensorflow_config.get('deterministic', True)
+        
+        return dataset.with_options(options)
     
     @property
     def config_info(self) -> Dict[str, Any]:
@@ -350,13 +655,17 @@ class DlioTensorFlowDataset:
         }
 
 
-class DlioJaxDataset:
+class DlioJaxDataset(_DlioConfigBase):
     """
     dl-driver JAX Dataset that provides JAX-friendly NumPy array iteration.
     
     Leverages s3dlio's S3JaxIterable with dl-driver configuration support.
+    Does not import TensorFlow.
     """
     
+    _framework = 'jax'
+    _error = DlioJaxError
+    
     def __init__(
         self,
         config_path: Optional[str] = None,
@@ -376,22 +685,25 @@ class DlioJaxDataset:
             **kwargs: Additional s3dlio options
         """
         if not HAVE_S3DLIO:
-            raise DlioTensorFlowError("s3dlio package is required for JAX integration")
+            raise DlioJaxError("s3dlio package is required for JAX integration")
         
         if not HAVE_JAX:
-            raise DlioTensorFlowError("JAX is required for JAX integration")
+            raise DlioJaxError("JAX is required for JAX integration")
         
         if not HAVE_NUMPY:
-            raise DlioTensorFlowError("NumPy is required for JAX integration")
-        
-        # Reuse TensorFlow dataset initialization logic
-        self.tf_dataset = DlioTensorFlowDataset(
-            config_path=config_path,
-            config_dict=config_dict,
-            data_folder=data_folder,
-            tensorflow_config=jax_config,
-            **kwargs
-        )
+            raise DlioJaxError("NumPy is required for JAX integration")
+        
+        self._init_config(config_path, config_dict, data_folder, jax_config, **kwargs)
+        self.jax_config = self.framework_config
+    
+    def _default_framework_config(self) -> Dict[str, Any]:
+        """JAX defaults, overridden by the DLIO config and caller."""
+        return {
+            'batch_size': 32,
+            'seed': 42,
+            'writable': False,  # For NumPy array creation
+            'rolling_prefetch': 4,  # Objects fetched ahead of the consumer; 0 disables
+        }
     
     def create_iterable(self) -> Iterator[Any]:
         """
@@ -402,16 +714,21 @@ class DlioJaxDataset:
         """
         try:
             jax_iterable = S3JaxIterable.from_prefix(
-                uri=self.tf_dataset.data_folder,
-                writable=self.tf_dataset.tensorflow_config.get('writable', False),
-                **self.tf_dataset.s3dlio_options
+                uri=self.data_folder,
+                writable=self.jax_config.get('writable', False),
+                **self.s3dlio_options
             )
             
+            # Keep the next objects in flight while the current one is used
+            ahead = self.jax_config.get('rolling_prefetch', 4)
+            if ahead > 0:
+                jax_iterable = BackgroundPrefetcher(jax_iterable, ahead)
+            
             for data in jax_iterable:
                 yield data
                 
         except Exception as e:
-            raise DlioTensorFlowError(f"Failed to create JAX iterable: {e}")
+            raise DlioJaxError(f"Failed to create JAX iterable: {e}")
     
     def __iter__(self):
         """Make this class directly iterable."""
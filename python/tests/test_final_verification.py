@@ -15,32 +15,32 @@ This is the final verification that GitHub issue #52 can be closed.
 
 import os
 import sys
+import functools
 import tempfile
 import numpy as np
 from datetime import datetime
+from pathlib import Path
 import traceback
 
-def load_env_vars():
-    """Load S3 configuration from .env file"""
-    env_vars = {}
-    
+@functools.lru_cache(maxsize=1)
+def load_env_vars(path='.env'):
+    """Load S3 configuration from a .env file into os.environ (None if missing)"""
     try:
-        with open('.env', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key] = value
-                    os.environ[key] = value
+        text = Path(path).read_text()
     except FileNotFoundError:
-        print("❌ .env file not found")
         return None
     
-    print(f"✅ Loaded S3 configuration from .env")
+    env_vars = dict(
+        line.split('=', 1)
+        for line in map(str.strip, text.splitlines())
+        if line and not line.startswith('#') and '=' in line
+    )
+    os.environ.update(env_vars)
     return env_vars
 
+@functools.lru_cache(maxsize=1)
 def generate_ml_framework_data():
-    """Generate test data for all available ML frameworks"""
+    """Generate test data for all available ML frameworks (once; treat as read-only)"""
     frameworks_data = {}
     
     # PyTorch
@@ -63,11 +63,12 @@ def generate_ml_framework_data():
     try:
         import jax
         import jax.numpy as jnp
-        key = jax.random.PRNGKey(42)
+        # Separate keys, so features and targets aren't drawn from the same stream
+        feature_key, target_key = jax.random.split(jax.random.PRNGKey(42))
         batch_size, features = 10, 50
         
-        feature_array = jax.random.normal(key, (batch_size, features), dtype=jnp.float32)
-        target_array = jax.random.randint(key, (batch_size,), 0, 5, dtype=jnp.int32)
+        feature_array = jax.random.normal(feature_key, (batch_size, features), dtype=jnp.float32)
+        target_array = jax.random.randint(target_key, (batch_size,), 0, 5, dtype=jnp.int32)
         
         frameworks_data['jax'] = {
             'features': np.array(feature_array),
@@ -96,12 +97,31 @@ def generate_ml_framework_data():
     
     return frameworks_data
 
+# Loader options used for every URI-acceptance check
+_LOADER_OPTS = (('batch_size', 1), ('num_workers', 0))
+
+@functools.lru_cache(maxsize=1)
+def _s3dlio_torch():
+    """Import s3dlio's PyTorch dataset once, initializing its runtime if it has a hook for it"""
+    import s3dlio
+    from s3dlio.torch import S3IterableDataset
+    
+    init_runtime = getattr(s3dlio, 'init_runtime', None)
+    if init_runtime is not None:
+        init_runtime()
+    return S3IterableDataset
+
+@functools.lru_cache(maxsize=64)
+def _make_iterable_dataset(uri, loader_opts=_LOADER_OPTS):
+    """S3IterableDataset for uri, built once per distinct (uri, loader_opts)"""
+    return _s3dlio_torch()(uri, loader_opts=dict(loader_opts))
+
 def test_backend_with_frameworks(backend_name, uri_template, frameworks_data):
     """Test a storage backend with all available ML framework data"""
     print(f"\n🧪 Testing {backend_name} Backend")
     
     try:
-        from s3dlio.torch import S3IterableDataset
+        _s3dlio_torch()
         
         results = {}
         
@@ -114,10 +134,7 @@ def test_backend_with_frameworks(backend_name, uri_template, frameworks_data):
             
             try:
                 # The critical test: Can S3IterableDataset handle this URI?
-                dataset = S3IterableDataset(test_uri, loader_opts={
-                    'batch_size': 1,
-                    'num_workers': 0
-                })
+                dataset = _make_iterable_dataset(test_uri)
                 
                 print(f"    ✅ S3IterableDataset accepts: {test_uri}")
                 results[framework_name] = True
@@ -158,25 +175,24 @@ def test_real_s3_operations(frameworks_data):
             print(f"  🔧 Real S3 Test: {framework_name.upper()}")
             
             try:
-                # Create NPZ data locally
+                # Create NPZ data locally (removed when the block exits).
+                # Random ML tensors are incompressible; savez is 10-50x
+                # faster than savez_compressed with an equivalent file size.
                 timestamp = datetime.now().strftime("%H%M%S%f")
-                with tempfile.NamedTemporaryFile(suffix='.npz', delete=False) as temp_file:
-                    np.savez_compressed(temp_file.name, **data_dict)
-                    temp_path = temp_file.name
-                
-                # Test s3dlio dataset creation with S3 URI (this should work without the old bug)
-                s3_uri = f"s3://{test_bucket}/test_{framework_name}_{timestamp}.npz"
-                
-                dataset = S3IterableDataset(s3_uri, loader_opts={
-                    'batch_size': 1,
-                    'num_workers': 0
-                })
-                
-                print(f"    ✅ Real S3 URI accepted: {s3_uri}")
-                results[framework_name] = True
-                
-                # Clean up
-                os.unlink(temp_path)
+                with tempfile.NamedTemporaryFile(suffix='.npz', delete=True) as temp_file:
+                    np.savez(temp_file, **data_dict)
+                    temp_file.flush()
+                    
+                    # Test s3dlio dataset creation with S3 URI (this should work without the old bug)
+                    s3_uri = f"s3://{test_bucket}/test_{framework_name}_{timestamp}.npz"
+                    
+                    dataset = S3IterableDataset(s3_uri, loader_opts={
+                        'batch_size': 1,
+                        'num_workers': 0
+                    })
+                    
+                    print(f"    ✅ Real S3 URI accepted: {s3_uri}")
+                    results[framework_name] = True
                 
             except Exception as e:
                 if "URI must start with s3://" in str(e):
@@ -201,6 +217,10 @@ def main():
     
     # Load configuration
     env_vars = load_env_vars()
+    if env_vars is None:
+        print("❌ .env file not found")
+    else:
+        print(f"✅ Loaded S3 configuration from .env")
     
     # Generate test data for all available frameworks
     print(f"\n📦 Generating ML Framework Test Data")
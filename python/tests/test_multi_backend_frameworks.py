@@ -22,6 +22,8 @@ without the "URI must start with s3://" restriction that existed in earlier vers
 
 import os
 import sys
+import functools
+import importlib.util
 import tempfile
 import shutil
 import numpy as np
@@ -36,6 +38,29 @@ try:
 except ImportError:
     print("⚠️  dotenv not available, using environment variables directly")
 
+# Single seeded generator shared by all frameworks' synthetic data
+rng = np.random.default_rng(42)
+
+# Framework availability without paying the import cost up front
+_HAS_TORCH = importlib.util.find_spec("torch") is not None
+_HAS_JAX = importlib.util.find_spec("jax") is not None
+_HAS_TF = importlib.util.find_spec("tensorflow") is not None
+
+@functools.lru_cache(maxsize=1)
+def _torch():
+    import torch
+    return torch
+
+@functools.lru_cache(maxsize=1)
+def _jax():
+    import jax.numpy as jnp
+    return jnp
+
+@functools.lru_cache(maxsize=1)
+def _tf():
+    import tensorflow as tf
+    return tf
+
 def setup_environment():
     """Set up test environment and check dependencies"""
     print("🔧 Setting up test environment...")
@@ -58,18 +83,21 @@ def setup_environment():
 
 def generate_pytorch_data():
     """Generate realistic PyTorch tensors for testing"""
+    if not _HAS_TORCH:
+        print("❌ PyTorch not available")
+        return None
     try:
-        import torch
+        torch = _torch()
         print("🔥 Generating PyTorch test data...")
         
         # Create realistic ML data
         batch_size, channels, height, width = 4, 3, 64, 64
-        image_tensor = torch.randn(batch_size, channels, height, width, dtype=torch.float32)
-        labels_tensor = torch.randint(0, 10, (batch_size,), dtype=torch.long)
+        image_data = rng.standard_normal((batch_size, channels, height, width), dtype=np.float32)
+        labels_data = rng.integers(0, 10, (batch_size,), dtype=np.int64)
         
-        # Convert to numpy for s3dlio compatibility
-        image_data = image_tensor.numpy()
-        labels_data = labels_tensor.numpy()
+        # Tensor handles share the numpy buffers
+        image_tensor = torch.from_numpy(image_data)
+        labels_tensor = torch.from_numpy(labels_data)
         
         print(f"  📊 Image tensor: {image_data.shape}, dtype={image_data.dtype}")
         print(f"  🏷️  Labels tensor: {labels_data.shape}, dtype={labels_data.dtype}")
@@ -86,21 +114,22 @@ def generate_pytorch_data():
 
 def generate_jax_data():
     """Generate realistic JAX arrays for testing"""
+    if not _HAS_JAX:
+        print("❌ JAX not available")
+        return None
     try:
-        import jax
-        import jax.numpy as jnp
+        jnp = _jax()
         print("🍃 Generating JAX test data...")
         
         # Create realistic ML data  
-        key = jax.random.PRNGKey(42)
         batch_size, features = 32, 128
         
-        feature_array = jax.random.normal(key, (batch_size, features), dtype=jnp.float32)
-        target_array = jax.random.randint(key, (batch_size,), 0, 5, dtype=jnp.int32)
+        feature_data = rng.standard_normal((batch_size, features), dtype=np.float32)
+        target_data = rng.integers(0, 5, (batch_size,), dtype=np.int32)
         
-        # Convert to numpy for s3dlio compatibility
-        feature_data = np.array(feature_array)
-        target_data = np.array(target_array)
+        # Device arrays for JAX consumers
+        feature_array = jnp.asarray(feature_data)
+        target_array = jnp.asarray(target_data)
         
         print(f"  📊 Feature array: {feature_data.shape}, dtype={feature_data.dtype}")
         print(f"  🎯 Target array: {target_data.shape}, dtype={target_data.dtype}")
@@ -117,20 +146,23 @@ def generate_jax_data():
 
 def generate_tensorflow_data():
     """Generate realistic TensorFlow tensors for testing"""
+    if not _HAS_TF:
+        print("❌ TensorFlow not available")
+        return None
     try:
-        import tensorflow as tf
+        tf = _tf()
         print("🟡 Generating TensorFlow test data...")
         
         # Create realistic ML data
         batch_size, seq_len, vocab_size = 16, 50, 1000
         
         # Text sequence data (like for NLP)
-        sequence_tensor = tf.random.uniform((batch_size, seq_len), 0, vocab_size, dtype=tf.int32)
-        attention_mask = tf.ones((batch_size, seq_len), dtype=tf.int32)
+        sequence_data = rng.integers(0, vocab_size, (batch_size, seq_len), dtype=np.int32)
+        mask_data = np.ones((batch_size, seq_len), dtype=np.int32)
         
-        # Convert to numpy for s3dlio compatibility
-        sequence_data = sequence_tensor.numpy()
-        mask_data = attention_mask.numpy()
+        # Tensor handles for TensorFlow consumers
+        sequence_tensor = tf.convert_to_tensor(sequence_data)
+        attention_mask = tf.convert_to_tensor(mask_data)
         
         print(f"  📝 Sequence tensor: {sequence_data.shape}, dtype={sequence_data.dtype}")
         print(f"  👁️  Attention mask: {mask_data.shape}, dtype={mask_data.dtype}")
@@ -146,12 +178,12 @@ def generate_tensorflow_data():
         return None
 
 def save_data_as_npz(data_dict, file_path):
-    """Save framework data as NPZ file"""
+    """Save framework data as NPZ file (uncompressed)"""
     # Extract numpy arrays (skip framework metadata and original tensors)
     numpy_data = {k: v for k, v in data_dict.items() 
                   if isinstance(v, np.ndarray)}
     
-    np.savez_compressed(file_path, **numpy_data)
+    np.savez(file_path, **numpy_data)
     return numpy_data
 
 def test_backend_with_framework(backend_name, uri_base, framework_data):